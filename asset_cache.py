@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: MIT
+"""assets/ 以下の画像のキャッシュ。
+
+起動時に assets/ の画像を一度だけ読み込み・デコードしておき（バックグラウンドスレッド可）、
+長押しや完了時のフィードバックではディスクにアクセスしないようにする。
+保持するのはデコード済みの QImage だけで、ファイルの中身（bytes）は残さない。
+効果音はパスで SoundEngine に渡し、そちらがデコード済みの WAV をキャッシュする。
+画像は (ui_scale, devicePixelRatio) ごとに拡大縮小済みの QPixmap をキャッシュして共有する
+（QPixmap は暗黙共有なので、同じインスタンスを複数のラベルに渡してもコピーは発生しない）。
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Dict, Optional, Set, Tuple
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImage, QPixmap
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".bmp", ".gif")
+
+
+def asset_path(name: str) -> str:
+    return os.path.join(ASSETS_DIR, name)
+
+
+class AssetCache:
+    """assets/ のシングルトンキャッシュ。
+
+    QImage のデコードはワーカースレッドでも行えるが、
+    QPixmap の生成は UI スレッドで行う必要があるため pixmap() の初回呼び出し時に変換する。
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AssetCache, cls).__new__(cls)
+            cls._instance._lock = threading.Lock()
+            cls._instance._images: Dict[str, QImage] = {}
+            # 読み込みを試みた名前（失敗したものも含む。再試行しない）
+            cls._instance._loaded: Set[str] = set()
+            cls._instance._pixmaps: Dict[Tuple[str, float, float], QPixmap] = {}
+            cls._instance._preload_thread = None
+        return cls._instance
+
+    def preload(self, background: bool = True) -> None:
+        """assets/ の全画像を読み込む。background=True ならデーモンスレッドで行う。"""
+        if background:
+            if self._preload_thread is None:
+                self._preload_thread = threading.Thread(target=self._preload_all, daemon=True)
+                self._preload_thread.start()
+            return
+        self._preload_all()
+
+    def _preload_all(self) -> None:
+        try:
+            names = sorted(os.listdir(ASSETS_DIR))
+        except OSError:
+            return
+        for name in names:
+            if name.lower().endswith(IMAGE_EXTS) and os.path.isfile(asset_path(name)):
+                self._load(name)
+
+    def _load(self, name: str) -> None:
+        """画像をデコードしてキャッシュする（読み込み済みなら何もしない）。"""
+        with self._lock:
+            if name in self._loaded:
+                return
+            self._loaded.add(name)
+            img = QImage(asset_path(name))
+            if not img.isNull():
+                self._images[name] = img
+
+    def image(self, name: str) -> Optional[QImage]:
+        self._load(name)
+        return self._images.get(name)
+
+    def pixmap(self, name: str, ui_scale: float = 1.0, dpr: float = 1.0) -> QPixmap:
+        """ui_scale を掛けた論理サイズで、dpr に合わせた解像度の QPixmap を返す（無ければ null）。
+
+        UI スレッドからのみ呼ぶこと。
+        """
+        key = (name, round(ui_scale, 3), round(dpr, 3))
+        pix = self._pixmaps.get(key)
+        if pix is not None:
+            return pix
+        img = self.image(name)
+        if img is None:
+            pix = QPixmap()
+        else:
+            factor = ui_scale * dpr
+            if abs(factor - 1.0) > 1e-3:
+                img = img.scaled(
+                    max(1, round(img.width() * factor)),
+                    max(1, round(img.height() * factor)),
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
+            pix = QPixmap.fromImage(img)
+            pix.setDevicePixelRatio(dpr)
+        self._pixmaps[key] = pix
+        return pix
@@ -3,19 +3,66 @@
 from __future__ import annotations
 
 import os
-from typing import List, Dict, Any, Optional, cast
-
-from googleapiclient.discovery import build
+import heapq
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urljoin
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple, cast
+
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build_from_document
+from googleapiclient.errors import HttpError
+from googleapiclient.http import BatchHttpRequest
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from google.auth.exceptions import RefreshError
 
+from task_diff import STATUS_COMPLETED, STATUS_NEEDS_ACTION
+
 # 読み書き可能スコープ（完了状態の反映に必要）
 SCOPES = ["https://www.googleapis.com/auth/tasks"]
 
 CREDENTIALS_FILE = "credentials.json"  # ダウンロードしたファイル名
 TOKEN_FILE = "token.json"              # 初回認可後に自動生成されるトークン
+TASK_CACHE_FILE = "tasks_cache.json"   # 差分同期用のローカルタスクストア
+
+DISCOVERY_CACHE_FILE = "tasks_discovery.json"  # ディスカバリドキュメントのディスクキャッシュ
+DISCOVERY_URL = "https://tasks.googleapis.com/$discovery/rest?version=v1"
+
+HTTP_TIMEOUT_SEC = 30                  # API 呼び出しのタイムアウト
+TOKEN_REFRESH_MARGIN_SEC = 300         # 期限切れの何秒前にバックグラウンド更新するか
+
+# partial response（fields パラメータ）のプロファイル。呼び出し側が使う項目だけを受け取る
+FIELDS_BOARD = "board"                 # ボード表示（全件/初回取得）
+FIELDS_SYNC_DELTA = "sync-delta"       # 差分同期（削除フラグも必要）
+FIELDS_WRITE_ACK = "write-ack"         # 完了/未完了の書き込み応答
+FIELDS_TASKLISTS = "tasklists"         # タスクリスト一覧
+_TASK_FIELDS = "id,title,notes,status,completed,updated,position"
+FIELD_PROFILES: Dict[str, str] = {
+    FIELDS_BOARD: f"items({_TASK_FIELDS}),nextPageToken",
+    FIELDS_SYNC_DELTA: f"items({_TASK_FIELDS},deleted),nextPageToken",
+    FIELDS_WRITE_ACK: "id,status,completed,updated",
+    FIELDS_TASKLISTS: "items(id,title),nextPageToken",
+}
+
+STALE_SYNC_STATUSES = (400, 410)      # updatedMin が古すぎて差分取得できないときの応答
+
+COMPLETED_WINDOW_DAYS = 1              # 完了済み取得の最初の期間（completedMin）
+COMPLETED_WINDOW_MAX_DAYS = 3650       # これより広げても足りなければ期間を区切らずに取得する
+
+
+def _write_token(creds: Credentials) -> None:
+    """token.json を一時ファイル経由でアトミックに書き込む。"""
+    tmp_path = TOKEN_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as token:
+        token.write(creds.to_json())
+    os.replace(tmp_path, TOKEN_FILE)
 
 
 def get_credentials() -> Credentials:
@@ -68,37 +115,289 @@ def get_credentials() -> Credentials:
         # トークン保存
         if creds is None:
             raise RuntimeError("OAuth 認可に失敗しました。")
-        with open(TOKEN_FILE, "w", encoding="utf-8") as token:
-            token.write(creds.to_json())
+        _write_token(creds)
 
     if creds is None:
         raise RuntimeError("OAuth 認可に失敗しました。")
     return creds
 
 
-def build_tasks_service(creds: Credentials):
-    """Google Tasks API の service クライアントを構築。"""
-    return build("tasks", "v1", credentials=creds)
+_discovery_doc: Optional[Dict[str, Any]] = None
+_discovery_lock = threading.Lock()
+
+
+def _is_tasks_discovery(doc: Any) -> bool:
+    return isinstance(doc, dict) and doc.get("name") == "tasks" and doc.get("version") == "v1"
+
+
+def _load_bundled_discovery() -> Optional[Dict[str, Any]]:
+    """クライアントライブラリ同梱のディスカバリドキュメントを読み込む。"""
+    try:
+        from googleapiclient.discovery_cache import get_static_doc
+    except ImportError:
+        return None
+    content = get_static_doc("tasks", "v1")
+    if not content:
+        return None
+    try:
+        doc = json.loads(content)
+    except ValueError:
+        return None
+    return doc if _is_tasks_discovery(doc) else None
+
+
+def _load_cached_discovery() -> Optional[Dict[str, Any]]:
+    """ディスクキャッシュのディスカバリドキュメントを読み込む。"""
+    try:
+        with open(DISCOVERY_CACHE_FILE, "r", encoding="utf-8") as f:
+            doc = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return doc if _is_tasks_discovery(doc) else None
+
+
+def _save_discovery_cache(doc: Dict[str, Any]) -> None:
+    tmp_path = DISCOVERY_CACHE_FILE + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(doc, f, ensure_ascii=False)
+        os.replace(tmp_path, DISCOVERY_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def load_discovery_document() -> Dict[str, Any]:
+    """Tasks API のディスカバリドキュメントをネットワークなしで取得する。
+
+    同梱版とディスクキャッシュのうち revision が新しい方を使い、
+    どちらも無い場合のみネットワークから取得してキャッシュする。結果はプロセス内で保持する。
+    """
+    global _discovery_doc
+    with _discovery_lock:
+        if _discovery_doc is not None:
+            return _discovery_doc
+        candidates = [d for d in (_load_cached_discovery(), _load_bundled_discovery()) if d]
+        if candidates:
+            # revision は YYYYMMDD 形式なので文字列比較で新旧が決まる
+            doc = max(candidates, key=lambda d: str(d.get("revision", "")))
+        else:
+            doc = _fetch_discovery_document(httplib2.Http(timeout=HTTP_TIMEOUT_SEC))
+            _save_discovery_cache(doc)
+        _discovery_doc = doc
+        return doc
+
+
+def _fetch_discovery_document(http) -> Dict[str, Any]:
+    resp, content = http.request(DISCOVERY_URL)
+    if resp.status >= 400:
+        raise RuntimeError(f"ディスカバリドキュメントの取得に失敗しました（HTTP {resp.status}）。")
+    doc = json.loads(content)
+    if not _is_tasks_discovery(doc):
+        raise RuntimeError("ディスカバリドキュメントの形式が不正です。")
+    return doc
+
+
+def update_discovery_cache(http=None) -> bool:
+    """ネットワークから最新のディスカバリドキュメントを取得し、新しければキャッシュを更新する。"""
+    global _discovery_doc
+    doc = _fetch_discovery_document(http or httplib2.Http(timeout=HTTP_TIMEOUT_SEC))
+    current = load_discovery_document()
+    if str(doc.get("revision", "")) <= str(current.get("revision", "")):
+        return False
+    _save_discovery_cache(doc)
+    with _discovery_lock:
+        _discovery_doc = doc
+    return True
+
+
+def build_tasks_service(creds: Optional[Credentials], http=None, api_endpoint: Optional[str] = None):
+    """Google Tasks API の service クライアントを構築。
+
+    ディスカバリドキュメントは load_discovery_document() のものを使うため、
+    構築時にネットワークへアクセスしない。http（認可済みトランスポート）を渡した場合はそれを使い回す。
+    api_endpoint を指定した場合はバッチリクエストの送信先（batch_uri）もそのエンドポイントにする。
+    """
+    doc = load_discovery_document()
+    client_options = {"api_endpoint": api_endpoint} if api_endpoint else None
+    if http is not None:
+        service = build_from_document(doc, http=http, client_options=client_options)
+    else:
+        service = build_from_document(doc, credentials=creds, client_options=client_options)
+    # new_batch_http_request() は discovery の rootUrl 固定で api_endpoint を無視するため、送信先を自前で持つ
+    service.batch_uri = urljoin(api_endpoint or doc.get("rootUrl") or "", doc.get("batchPath") or "batch")
+    return service
+
+
+class ClientManager:
+    """プロセス全体で 1 つの Credentials と Tasks service を保持するシングルトン。
+
+    - Credentials は一度だけ token.json から読み込み、以降はメモリ上のものを使う
+    - 期限切れ前にバックグラウンドでリフレッシュし、トークンが変わったときだけ保存する
+    - 状態を守るロック（_lock）は短時間しか持たず、通信やブラウザでの認可は別のロック（_refresh_lock）で
+      1 スレッドに絞って行う。有効な Credentials を持っている間、他のスレッドはリフレッシュを待たない
+    - httplib2.Http はスレッドセーフではないため、service（と keep-alive 接続）はスレッドごとに保持する
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ClientManager, cls).__new__(cls)
+            cls._instance._lock = threading.Lock()
+            cls._instance._refresh_lock = threading.Lock()
+            cls._instance._creds = None
+            cls._instance._token_json = None
+            cls._instance._generation = 0
+            cls._instance._local = threading.local()
+            cls._instance._refresh_timer = None
+        return cls._instance
+
+    def credentials(self) -> Credentials:
+        """有効な Credentials を返す。期限切れならその場でリフレッシュする。"""
+        with self._lock:
+            creds = self._creds
+        if creds is not None and creds.valid:
+            return creds
+        with self._refresh_lock:
+            with self._lock:
+                creds = self._creds
+                generation = self._generation
+            # 待っている間に別のスレッドがリフレッシュ済みならそれを使う
+            if creds is not None and creds.valid:
+                return creds
+            new_creds = None
+            if creds is not None:
+                try:
+                    creds.refresh(Request())
+                except Exception:
+                    # リフレッシュ不可（取り消し等）は通常の認可処理にフォールバック
+                    new_creds = get_credentials()
+            else:
+                new_creds = get_credentials()
+            with self._lock:
+                if self._generation == generation:
+                    if new_creds is not None:
+                        self._set_credentials(new_creds)
+                    else:
+                        self._persist_if_changed()
+                        self._schedule_refresh()
+                # reset() 等で差し替えられていればそちらを優先する
+                return self._creds if self._creds is not None else (new_creds or creds)
+
+    def service(self):
+        """呼び出しスレッド用の Tasks service を返す（同一スレッドでは再利用）。"""
+        creds = self.credentials()
+        local = self._local
+        if getattr(local, "generation", None) != self._generation or getattr(local, "service", None) is None:
+            http = AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT_SEC))
+            local.service = build_tasks_service(creds, http=http)
+            local.generation = self._generation
+        return local.service
+
+    def reset(self, creds: Optional[Credentials] = None) -> None:
+        """保持している Credentials/service を破棄する（再認可後など）。"""
+        with self._lock:
+            if creds is not None:
+                self._set_credentials(creds)
+            else:
+                self._cancel_refresh()
+                self._creds = None
+                self._token_json = None
+                self._generation += 1
+
+    def _set_credentials(self, creds: Credentials) -> None:
+        self._creds = creds
+        # get_credentials/force_reauthorize が保存済みなので、現在の内容を基準にする
+        self._token_json = creds.to_json()
+        self._generation += 1
+        self._schedule_refresh()
+
+    def _persist_if_changed(self) -> None:
+        if self._creds is None:
+            return
+        token_json = self._creds.to_json()
+        if token_json == self._token_json:
+            return
+        try:
+            _write_token(self._creds)
+            self._token_json = token_json
+        except OSError:
+            pass
+
+    def _cancel_refresh(self) -> None:
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+
+    def _schedule_refresh(self) -> None:
+        self._cancel_refresh()
+        creds = self._creds
+        if creds is None or not creds.refresh_token or creds.expiry is None:
+            return
+        # Credentials.expiry は naive な UTC
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        delay = (creds.expiry - now).total_seconds() - TOKEN_REFRESH_MARGIN_SEC
+        timer = threading.Timer(max(1.0, delay), self._background_refresh)
+        timer.daemon = True
+        self._refresh_timer = timer
+        timer.start()
+
+    def _background_refresh(self) -> None:
+        with self._refresh_lock:
+            with self._lock:
+                creds = self._creds
+            if creds is None:
+                return
+            # 通信中は _lock を持たない（他のスレッドは現在のトークンでそのまま通信できる）
+            try:
+                creds.refresh(Request())
+            except Exception:
+                # 失敗時は次回の credentials() 呼び出しで再試行される
+                with self._lock:
+                    self._refresh_timer = None
+                return
+            with self._lock:
+                if self._creds is creds:
+                    self._persist_if_changed()
+                    self._schedule_refresh()
+
+
+def get_service():
+    """プロセス共有の ClientManager から Tasks service を取得する。"""
+    return ClientManager().service()
 
 
-def list_tasklists(service, max_results: int = 100) -> List[Dict[str, Any]]:
+def field_mask(profile: Optional[str]) -> Optional[str]:
+    """プロファイル名から fields パラメータの値を返す（None ならマスクなし＝全項目）。"""
+    if profile is None:
+        return None
+    return FIELD_PROFILES[profile]
+
+
+def list_tasklists(service, max_results: int = 100, fields: Optional[str] = FIELDS_TASKLISTS) -> List[Dict[str, Any]]:
     """タスクリスト一覧を取得。"""
-    results = service.tasklists().list(maxResults=max_results).execute()
+    results = service.tasklists().list(maxResults=max_results, fields=field_mask(fields)).execute()
     return results.get("items", [])
 
 
-def list_tasks(
+def iter_task_pages(
     service,
     tasklist_id: str,
     show_completed: bool = True,
     show_deleted: bool = False,
     show_hidden: bool = False,
     max_results: int = 100,
-) -> List[Dict[str, Any]]:
-    """指定タスクリストのタスクを全件取得（ページング対応）。"""
-    tasks: List[Dict[str, Any]] = []
+    updated_min: Optional[str] = None,
+    completed_min: Optional[str] = None,
+    completed_max: Optional[str] = None,
+    fields: Optional[str] = FIELDS_BOARD,
+) -> Iterator[List[Dict[str, Any]]]:
+    """指定タスクリストのタスクを 1 ページずつ返すジェネレータ。
+
+    次のページは前のページを消費してから取得するので、呼び出し側は届いた分から処理できる。
+    引数は list_tasks と同じ。
+    """
     page_token: Optional[str] = None
-
     while True:
         req = service.tasks().list(
             tasklist=tasklist_id,
@@ -106,35 +405,435 @@ def list_tasks(
             showCompleted=show_completed,
             showDeleted=show_deleted,
             showHidden=show_hidden,
+            updatedMin=updated_min,
+            completedMin=completed_min,
+            completedMax=completed_max,
             pageToken=page_token,
+            fields=field_mask(fields),
         )
         res = req.execute()
-        tasks.extend(res.get("items", []))
+        yield res.get("items", [])
         page_token = res.get("nextPageToken")
         if not page_token:
-            break
+            return
+
+
+def list_tasks(
+    service,
+    tasklist_id: str,
+    show_completed: bool = True,
+    show_deleted: bool = False,
+    show_hidden: bool = False,
+    max_results: int = 100,
+    updated_min: Optional[str] = None,
+    completed_min: Optional[str] = None,
+    completed_max: Optional[str] = None,
+    fields: Optional[str] = FIELDS_BOARD,
+) -> List[Dict[str, Any]]:
+    """指定タスクリストのタスクを全件取得（ページング対応）。
 
+    updated_min (RFC3339) を指定すると、それ以降に更新されたタスクのみを取得する。
+    completed_min / completed_max で完了日時の範囲を絞り込める。
+    fields は FIELD_PROFILES のプロファイル名（None なら全項目を受け取る）。
+    """
+    tasks: List[Dict[str, Any]] = []
+    for page in iter_task_pages(
+        service,
+        tasklist_id,
+        show_completed=show_completed,
+        show_deleted=show_deleted,
+        show_hidden=show_hidden,
+        max_results=max_results,
+        updated_min=updated_min,
+        completed_min=completed_min,
+        completed_max=completed_max,
+        fields=fields,
+    ):
+        tasks.extend(page)
     return tasks
 
 
+def _rfc3339(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def list_recent_completed(
+    service,
+    tasklist_id: str,
+    min_count: int,
+    initial_days: int = COMPLETED_WINDOW_DAYS,
+    max_days: int = COMPLETED_WINDOW_MAX_DAYS,
+    now: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    """最近完了したタスクを min_count 件集まるまで、期間を倍々に広げながら取得する。
+
+    直近 initial_days 日から始め、広げるたびに前回の期間の外側（completedMax = 前回の completedMin）
+    だけを問い合わせるので、同じタスクを何度も取得しない。max_days を超えたら残りを期間を区切らずに取得する。
+    ページの大きさは min_count に合わせ、min_count 件に達した時点で残りのページは取得しない。
+    """
+    if min_count <= 0:
+        return []
+    now = now or datetime.now(timezone.utc)
+    found: Dict[str, Dict[str, Any]] = {}
+    upper: Optional[str] = None
+    days = max(1, initial_days)
+    while True:
+        lower = _rfc3339(now - timedelta(days=days)) if days <= max_days else None
+        pages = iter_task_pages(
+            service,
+            tasklist_id,
+            show_completed=True,
+            show_hidden=True,
+            max_results=min(100, min_count),
+            completed_min=lower,
+            completed_max=upper,
+        )
+        for page in pages:
+            for t in page:
+                if t.get("status") == STATUS_COMPLETED and t.get("id"):
+                    found[t["id"]] = t
+            if len(found) >= min_count:
+                pages.close()
+                return list(found.values())
+        if lower is None:
+            return list(found.values())
+        upper = lower
+        days *= 2
+
+
+def fetch_board_tasks(
+    service,
+    tasklist_id: str,
+    min_completed: int,
+    service_factory: Optional[Callable[[], Any]] = None,
+    now: Optional[datetime] = None,
+    on_page: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """ボード表示に必要なタスクだけを取得する（未完了は全件、完了済みは最近の分だけ）。
+
+    未完了（showCompleted=False）と最近の完了済み（completedMin）の 2 つの問い合わせを並行して行う。
+    完了済み側は別スレッドで実行するため、そのスレッド用の service を service_factory で作る
+    （service はスレッドセーフではない）。
+    on_page を渡すと、未完了タスクのページが届くたびに（呼び出しスレッド上で）呼ばれる。
+    """
+    def _open_tasks() -> List[Dict[str, Any]]:
+        tasks: List[Dict[str, Any]] = []
+        for page in iter_task_pages(service, tasklist_id, show_completed=False):
+            tasks.extend(page)
+            if on_page is not None:
+                on_page(page)
+        return tasks
+
+    if min_completed <= 0:
+        return _open_tasks()
+    factory = service_factory or get_service
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        completed_future = pool.submit(
+            lambda: list_recent_completed(factory(), tasklist_id, min_completed, now=now)
+        )
+        open_tasks = _open_tasks()
+        completed = completed_future.result()
+    return open_tasks + completed
+
+
+class TaskDeltaStore:
+    """タスク ID をキーにしたローカルストア。差分同期（updatedMin）の結果をマージして保持する。
+
+    初回（またはリスト切替時）は未完了の全件と最近完了した min_completed 件以上を取得し
+    （fetch_board_tasks）、以降は前回取得分の最大 updated を高水位マークとして
+    updatedMin + showDeleted で変更分だけを取得する。
+    完了済みは完了日時が新しい min_completed 件だけを残し、履歴が伸びても保持量は増えない。
+    差分のマージで完了済みが min_completed を割ったときは list_recent_completed で補充する。
+    内容は TASK_CACHE_FILE に保存し、再起動後も差分同期を継続できる。
+    保存済みの内容は最初の sync() の中で（同期スレッド上で）読み込むので、生成は軽い。
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        path: str = TASK_CACHE_FILE,
+        min_completed: int = 2,
+        service_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self.path = path
+        self.min_completed = min_completed
+        self.service_factory = service_factory
+        self.tasklist_id: Optional[str] = None
+        self.updated_min: Optional[str] = None
+        self.tasks: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def load(self) -> None:
+        """保存済みストアを読み込む。壊れている/形式が違う場合は空から始める。"""
+        self._loaded = True
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return
+        tasks = data.get("tasks")
+        if not isinstance(tasks, dict):
+            return
+        self.tasklist_id = data.get("tasklist_id")
+        self.updated_min = data.get("updated_min")
+        self.tasks = tasks
+        self._prune_completed()
+
+    def save(self) -> None:
+        """ストアを一時ファイル経由でアトミックに保存する。"""
+        data = {
+            "version": self.VERSION,
+            "tasklist_id": self.tasklist_id,
+            "updated_min": self.updated_min,
+            "tasks": self.tasks,
+        }
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    def reset(self) -> None:
+        self.tasklist_id = None
+        self.updated_min = None
+        self.tasks = {}
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """保持しているタスクを返す。未完了は position 順、完了済みはその後ろに保持順で並べる。
+
+        完了済みは表示側で完了日時の新しいものだけを選ぶので、履歴全体を並べ替えない。
+        """
+        open_items = []
+        completed = []
+        for t in self.tasks.values():
+            (completed if t.get("status") == STATUS_COMPLETED else open_items).append(t)
+        open_items.sort(key=lambda t: t.get("position") or "")
+        open_items.extend(completed)
+        return open_items
+
+    def sync(
+        self,
+        service,
+        tasklist_id: str,
+        on_page: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """差分同期を行い、マージ後の全タスクを返す。
+
+        全件取得になった場合は、未完了タスクのページが届くたびに on_page が呼ばれる
+        （差分取得は件数が少ないので呼ばれない）。
+        """
+        with self._lock:
+            if not self._loaded:
+                self.load()
+            if self.tasklist_id != tasklist_id or not self.updated_min:
+                self._full_sync(service, tasklist_id, on_page)
+            else:
+                try:
+                    changed = list_tasks(
+                        service,
+                        tasklist_id,
+                        show_completed=True,
+                        show_deleted=True,
+                        show_hidden=True,
+                        updated_min=self.updated_min,
+                        fields=FIELDS_SYNC_DELTA,
+                    )
+                except HttpError as e:
+                    # 高水位マークが古すぎる（400/410）場合だけ全件取得に戻す。
+                    # 429/5xx や通信エラーはそのまま送出し、同期ワーカーのバックオフに任せる
+                    if http_error_status(e) not in STALE_SYNC_STATUSES:
+                        raise
+                    self._full_sync(service, tasklist_id, on_page)
+                else:
+                    if changed:
+                        before = self._completed_count()
+                        self._merge(changed)
+                        after = self._completed_count()
+                        # 完了の取り消しや削除で min_completed を割った場合は、
+                        # 差分には含まれない古い完了済みを取り直して補充する
+                        if after < self.min_completed and after < before:
+                            self._refill_completed(service, tasklist_id)
+                        self.save()
+            return self.snapshot()
+
+    def _completed_count(self) -> int:
+        return sum(1 for t in self.tasks.values() if t.get("status") == STATUS_COMPLETED)
+
+    def _refill_completed(self, service, tasklist_id: str) -> None:
+        """最近完了した min_completed 件を取り直してマージする（高水位マークは進めない）。"""
+        updated_min = self.updated_min
+        self._merge(list_recent_completed(service, tasklist_id, self.min_completed))
+        self.updated_min = updated_min
+
+    def _full_sync(self, service, tasklist_id: str, on_page=None) -> None:
+        tasks = fetch_board_tasks(service, tasklist_id, self.min_completed, self.service_factory, on_page=on_page)
+        self.reset()
+        self.tasklist_id = tasklist_id
+        self._merge(tasks)
+        self.save()
+
+    def _merge(self, items: List[Dict[str, Any]]) -> None:
+        for t in items:
+            task_id = t.get("id")
+            if not task_id:
+                continue
+            if t.get("deleted"):
+                self.tasks.pop(task_id, None)
+            else:
+                self.tasks[task_id] = t
+            updated = t.get("updated")
+            # RFC3339 (UTC, 'Z' 終端) なので文字列比較で大小が決まる
+            if updated and (not self.updated_min or updated > self.updated_min):
+                self.updated_min = updated
+        self._prune_completed()
+
+    def _prune_completed(self) -> None:
+        """完了済みは完了日時が新しい min_completed 件だけを残す。"""
+        completed = [t for t in self.tasks.values() if t.get("status") == STATUS_COMPLETED]
+        excess = len(completed) - max(0, self.min_completed)
+        if excess <= 0:
+            return
+        # completed も RFC3339 (UTC) なので文字列比較で新旧が決まる
+        for t in heapq.nsmallest(excess, completed, key=lambda t: t.get("completed") or ""):
+            self.tasks.pop(t["id"], None)
+
+BATCH_MAX_SIZE = 50                    # 1 回のバッチリクエストに詰める件数
+BATCH_MAX_RETRIES = 3                  # 一時的エラーの再試行回数
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _status_body(status: str) -> Dict[str, Any]:
+    """status 更新用の patch ボディを作る。"""
+    if status == STATUS_COMPLETED:
+        return {
+            "status": STATUS_COMPLETED,
+            "completed": datetime.now(timezone.utc).isoformat(),
+        }
+    if status == STATUS_NEEDS_ACTION:
+        return {
+            "status": STATUS_NEEDS_ACTION,
+            # completed をクリア（None または未指定）。未指定でも未完了扱いになるが明示的に None を送る。
+            "completed": None,
+        }
+    raise ValueError(f"不明なステータスです: {status}")
+
+
 def complete_task(service, tasklist_id: str, task_id: str) -> Dict[str, Any]:
     """指定タスクを完了に更新（Google Tasks 側へ反映）。"""
-    from datetime import datetime, timezone
-
-    completed_time = datetime.now(timezone.utc).isoformat()
-    body = {
-        "status": "completed",
-        "completed": completed_time,
-    }
-    return service.tasks().patch(tasklist=tasklist_id, task=task_id, body=body).execute()
+    body = _status_body(STATUS_COMPLETED)
+    return service.tasks().patch(
+        tasklist=tasklist_id, task=task_id, body=body, fields=field_mask(FIELDS_WRITE_ACK)
+    ).execute()
+
+
 def uncomplete_task(service, tasklist_id: str, task_id: str) -> Dict[str, Any]:
     """指定タスクの完了を取り消して未完了に更新。"""
-    body = {
-        "status": "needsAction",
-        # completed をクリア（None または未指定）。未指定でも未完了扱いになるが明示的に None を送る。
-        "completed": None,
-    }
-    return service.tasks().patch(tasklist=tasklist_id, task=task_id, body=body).execute()
+    body = _status_body(STATUS_NEEDS_ACTION)
+    return service.tasks().patch(
+        tasklist=tasklist_id, task=task_id, body=body, fields=field_mask(FIELDS_WRITE_ACK)
+    ).execute()
+
+
+def http_error_status(exc: Optional[BaseException]) -> Optional[int]:
+    """HttpError などから HTTP ステータスを取り出す。"""
+    if exc is None:
+        return None
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        resp = getattr(exc, "resp", None)
+        status = getattr(resp, "status", None)
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def apply_status_changes(
+    tasklist_id: str,
+    changes: List[Tuple[str, str]],
+    service=None,
+    batch_size: int = BATCH_MAX_SIZE,
+    max_retries: int = BATCH_MAX_RETRIES,
+) -> List[Dict[str, Any]]:
+    """複数タスクの完了/未完了をバッチリクエストでまとめて反映する。
+
+    changes は (task_id, status) のリスト（status は "completed" / "needsAction"）。
+    batch_size 件ごとに 1 回の HTTP リクエストで送り、429/5xx などの一時的な失敗だけを
+    指数バックオフで再試行する。戻り値は入力と同じ順序の結果
+    {"task_id", "status", "ok", "response", "error"} のリスト。
+    """
+    if service is None:
+        service = get_service()
+    results: List[Dict[str, Any]] = [
+        {"task_id": task_id, "status": status, "ok": False, "response": None, "error": None}
+        for task_id, status in changes
+    ]
+    pending = list(range(len(results)))
+    attempt = 0
+    while pending:
+        retry: List[int] = []
+        for offset in range(0, len(pending), batch_size):
+            chunk = pending[offset:offset + batch_size]
+            _execute_status_batch(service, tasklist_id, chunk, results)
+            for idx in chunk:
+                res = results[idx]
+                if res["ok"]:
+                    continue
+                err = res["error"]
+                if isinstance(err, ValueError):
+                    continue
+                status = http_error_status(err)
+                if status is None or status in RETRYABLE_STATUSES:
+                    retry.append(idx)
+        attempt += 1
+        if not retry or attempt > max_retries:
+            break
+        time.sleep(min(30.0, (2 ** (attempt - 1)) + random.random()))
+        pending = retry
+    return results
+
+
+def _execute_status_batch(service, tasklist_id: str, indices: List[int], results: List[Dict[str, Any]]) -> None:
+    def _callback(request_id, response, exception):
+        res = results[int(request_id)]
+        if exception is not None:
+            res["ok"] = False
+            res["error"] = exception
+        else:
+            res["ok"] = True
+            res["response"] = response
+            res["error"] = None
+
+    batch_uri = getattr(service, "batch_uri", None)
+    if batch_uri:
+        batch = BatchHttpRequest(callback=_callback, batch_uri=batch_uri)
+    else:
+        batch = service.new_batch_http_request(callback=_callback)
+    for idx in indices:
+        res = results[idx]
+        res["error"] = None
+        try:
+            body = _status_body(res["status"])
+        except ValueError as e:
+            res["error"] = e
+            continue
+        req = service.tasks().patch(
+            tasklist=tasklist_id, task=res["task_id"], body=body, fields=field_mask(FIELDS_WRITE_ACK)
+        )
+        batch.add(req, request_id=str(idx))
+    try:
+        batch.execute()
+    except Exception as e:
+        # バッチ全体の失敗（接続エラー等）は未確定の項目すべてを失敗扱いにする
+        for idx in indices:
+            if not results[idx]["ok"] and results[idx]["error"] is None:
+                results[idx]["error"] = e
 
 
 def force_reauthorize() -> Credentials:
@@ -143,18 +842,18 @@ def force_reauthorize() -> Credentials:
     if not flow:
         raise FileNotFoundError(f"{CREDENTIALS_FILE} が見つかりません。")
     creds = cast(Credentials, flow.run_local_server(port=0))
-    with open(TOKEN_FILE, "w", encoding="utf-8") as token:
-        token.write(creds.to_json())
+    _write_token(creds)
+    ClientManager().reset(creds)
     return creds
 
 
 def main():
     # トークン失効や取り消し時も再認可にフォールバック
     try:
-        creds = get_credentials()
+        service = get_service()
     except RefreshError:
-        creds = force_reauthorize()
-    service = build_tasks_service(creds)
+        force_reauthorize()
+        service = get_service()
 
     # 1) タスクリスト一覧を表示
     tasklists = list_tasklists(service)
@@ -168,7 +867,7 @@ def main():
 
     # 2) 例として先頭のタスクリストのタスクを取得
     first_list_id = tasklists[0]["id"]
-    tasks = list_tasks(service, first_list_id, show_completed=True, show_hidden=True)
+    tasks = list_tasks(service, first_list_id, show_completed=True, show_hidden=True, fields=None)
 
     print(f"\n[{tasklists[0].get('title')}] のタスク:")
     if not tasks:
@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: MIT
+"""完了/未完了の書き込みのバッチ化の計測と、項目ごとの結果・部分失敗の再送の確認。
+
+ローカルのスタンドイン Tasks API サーバーに対して
+- single : 1 件ずつ PATCH（complete_task）
+- batch  : backend.apply_status_changes（BATCH_MAX_SIZE 件ずつ 1 回のバッチリクエスト）
+のリクエスト数・所要時間を比較する。
+続けて、一部のタスクに 503（1 回だけ）と 404 を注入してバッチで送り、
+503 の項目だけが再送されて成功し、404 の項目は失敗として返ることを確認する。
+
+    python benchmarks/bench_batch_writes.py [--changes 100] [--latency-ms 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import httplib2  # noqa: E402
+
+import backend  # noqa: E402
+from fake_tasks_server import TASKLIST_ID, FakeTasksServer, make_tasks  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--changes", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="疑似ネットワーク遅延（1 リクエストあたり）")
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.changes * 2, completed_ratio=0.0)
+    doc = backend.load_discovery_document()
+    server = FakeTasksServer(tasks, latency_ms=args.latency_ms, discovery_doc=doc).start()
+    try:
+        service = backend.build_tasks_service(None, http=httplib2.Http(), api_endpoint=server.url)
+        ids = [t["id"] for t in tasks]
+
+        server.reset_stats()
+        t0 = time.perf_counter()
+        for task_id in ids[: args.changes]:
+            backend.complete_task(service, TASKLIST_ID, task_id)
+        single_ms = (time.perf_counter() - t0) * 1000
+        print(f"single {args.changes:5d} changes  {server.request_count:5d} requests  {single_ms:9.1f} ms")
+
+        changes = [(task_id, backend.STATUS_COMPLETED) for task_id in ids[args.changes:]]
+        server.reset_stats()
+        t0 = time.perf_counter()
+        results = backend.apply_status_changes(TASKLIST_ID, changes, service=service)
+        batch_ms = (time.perf_counter() - t0) * 1000
+        print(f"batch  {args.changes:5d} changes  {server.request_count:5d} requests  {batch_ms:9.1f} ms")
+        failed = [r["task_id"] for r in results if not r["ok"]]
+        assert not failed, f"失敗した項目があります: {failed}"
+
+        # 部分失敗：1 件目は 503 を 1 回だけ返して再送で成功、存在しないタスクは 404 のまま失敗
+        flaky, missing = ids[0], "no-such-task"
+        server.fail(flaky, 503)
+        changes = [(flaky, backend.STATUS_NEEDS_ACTION), (ids[1], backend.STATUS_NEEDS_ACTION), (missing, backend.STATUS_COMPLETED)]
+        server.reset_stats()
+        results = backend.apply_status_changes(TASKLIST_ID, changes, service=service, max_retries=1)
+        by_id = {r["task_id"]: r for r in results}
+        assert [r["task_id"] for r in results] == [c[0] for c in changes], "結果の順序が入力と一致しません"
+        assert by_id[flaky]["ok"], "503 の項目が再送で成功していません"
+        assert by_id[ids[1]]["ok"] and by_id[ids[1]]["response"]["status"] == backend.STATUS_NEEDS_ACTION
+        assert not by_id[missing]["ok"] and backend.http_error_status(by_id[missing]["error"]) == 404
+        # 1 回目のバッチ + 503 の項目だけの再送バッチ
+        assert server.request_count == 2, f"リクエスト数が想定と異なります: {server.request_count}"
+        print("partial failure: 503 retried and succeeded, 404 reported per item (2 requests)")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: MIT
+"""初回同期の取得量の比較。
+
+完了済みの履歴が長いリストに対して
+- full : 全件取得（showCompleted=True, showHidden=True）
+- plan : backend.fetch_board_tasks（未完了は全件、完了済みは completedMin の期間を広げながら最近の分だけ）
+のリクエスト数・受信バイト数・所要時間を比較する。
+
+    python benchmarks/bench_fetch_plan.py [--tasks 20000] [--open 50] [--history 2] [--latency-ms 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import httplib2  # noqa: E402
+
+import backend  # noqa: E402
+from fake_tasks_server import TASKLIST_ID, FakeTasksServer, make_tasks  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--open", type=int, default=50, help="未完了タスクの件数")
+    parser.add_argument("--history", type=int, default=2, help="履歴パネルに必要な完了済みの件数")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="疑似ネットワーク遅延（1 リクエストあたり）")
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.tasks, completed_ratio=1 - args.open / args.tasks)
+    # 「現在時刻」は最後に完了したタスクの直後とする（make_tasks は 1 分刻みの過去日時を振る）
+    now = max(datetime.fromisoformat(t["completed"].replace("Z", "+00:00")) for t in tasks if t.get("completed"))
+
+    doc = backend.load_discovery_document()
+    server = FakeTasksServer(tasks, latency_ms=args.latency_ms, discovery_doc=doc).start()
+    try:
+        def make_service():
+            return backend.build_tasks_service(None, http=httplib2.Http(), api_endpoint=server.url)
+
+        service = make_service()
+
+        def run(label, fetch) -> None:
+            server.reset_stats()
+            t0 = time.perf_counter()
+            items = fetch()
+            ms = (time.perf_counter() - t0) * 1000
+            print(
+                f"{label:<6} {len(items):7d} tasks  {server.request_count:5d} requests"
+                f"  {server.bytes_sent / 1024:10.1f} KiB  {ms:9.1f} ms"
+            )
+
+        print(f"{args.tasks} tasks ({args.open} open), history={args.history}, latency={args.latency_ms} ms/request")
+        run("full", lambda: backend.list_tasks(service, TASKLIST_ID, show_completed=True, show_hidden=True))
+        run("plan", lambda: backend.fetch_board_tasks(service, TASKLIST_ID, args.history, make_service, now=now))
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
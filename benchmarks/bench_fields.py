@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: MIT
+"""partial response（fields マスク）の効果の計測。
+
+ローカルのスタンドイン Tasks API サーバーからタスク一覧を全ページ取得し、
+マスクなし（全項目）と backend.FIELD_PROFILES の各プロファイルとで
+- 1 回の同期あたりの受信バイト数
+- JSON のパース時間（受信済みの本文を json.loads するだけの時間）
+- backend.list_tasks 経由の所要時間
+を比較する。
+
+    python benchmarks/bench_fields.py [--tasks 5000] [--runs 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import List, Optional
+from urllib.parse import urlencode
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import httplib2  # noqa: E402
+
+import backend  # noqa: E402
+from fake_tasks_server import TASKLIST_ID, FakeTasksServer, make_tasks  # noqa: E402
+
+
+def _fetch_raw_pages(http: httplib2.Http, base_url: str, fields: Optional[str]) -> List[bytes]:
+    """list_tasks と同じ条件で全ページの本文をそのまま取得する。"""
+    bodies = []
+    page_token = None
+    while True:
+        params = {"maxResults": 100, "showCompleted": "true", "showHidden": "true"}
+        if fields:
+            params["fields"] = fields
+        if page_token:
+            params["pageToken"] = page_token
+        _resp, body = http.request(f"{base_url}tasks/v1/lists/{TASKLIST_ID}/tasks?{urlencode(params)}")
+        bodies.append(body)
+        page_token = json.loads(body).get("nextPageToken")
+        if not page_token:
+            return bodies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    doc = backend.load_discovery_document()
+    server = FakeTasksServer(make_tasks(args.tasks), discovery_doc=doc).start()
+    try:
+        http = httplib2.Http()
+        service = backend.build_tasks_service(None, http=httplib2.Http(), api_endpoint=server.url)
+        profiles = [None, backend.FIELDS_BOARD, backend.FIELDS_SYNC_DELTA]
+        print(f"{args.tasks} tasks, median of {args.runs} runs")
+        for profile in profiles:
+            mask = backend.field_mask(profile)
+            server.reset_stats()
+            bodies = _fetch_raw_pages(http, server.url, mask)
+            sent = server.bytes_sent
+
+            parse_ms = []
+            for _ in range(args.runs):
+                t0 = time.perf_counter()
+                for body in bodies:
+                    json.loads(body)
+                parse_ms.append((time.perf_counter() - t0) * 1000)
+
+            total_ms = []
+            for _ in range(args.runs):
+                t0 = time.perf_counter()
+                backend.list_tasks(service, TASKLIST_ID, show_completed=True, show_hidden=True, fields=profile)
+                total_ms.append((time.perf_counter() - t0) * 1000)
+
+            label = profile or "no mask"
+            print(
+                f"{label:<12} {sent / 1024:10.1f} KiB  parse {statistics.median(parse_ms):8.2f} ms"
+                f"  list_tasks {statistics.median(total_ms):8.1f} ms"
+            )
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
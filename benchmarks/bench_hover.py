@@ -0,0 +1,94 @@
+# SPDX-License-Identifier: MIT
+"""カードのホバー処理コストのマイクロベンチマーク。
+
+テーマのスタイルシートを適用したボードに TaskWidget を並べ、全カードへ Enter/Leave を送って
+1 イベントあたりの処理時間を比較する。
+- legacy : 以前の実装（ホバーのたびに per-widget の setStyleSheet で CSS を生成・解析）
+- current: card_state プロパティの切り替え（解析済みのテーマ QSS を再マッチするだけ）
+
+    python benchmarks/bench_hover.py [--cards 60] [--rounds 20]
+
+GUI の無い環境では QT_QPA_PLATFORM=offscreen を指定して実行する。
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from PyQt6.QtCore import QEvent, QPointF  # noqa: E402
+from PyQt6.QtGui import QEnterEvent  # noqa: E402
+from PyQt6.QtWidgets import QApplication, QGridLayout, QWidget  # noqa: E402
+
+from main import TaskWidget  # noqa: E402
+from theme_manager import ThemeManager  # noqa: E402
+
+
+class LegacyTaskWidget(TaskWidget):
+    """比較用：ホバーごとに per-widget スタイルシートを設定していた以前の挙動。"""
+
+    def enterEvent(self, event):
+        if not self._long_pressed and not self._is_focus:
+            is_dark = ThemeManager().is_dark
+            bg = "#252525" if is_dark else "#FAFAFA"
+            self.setStyleSheet(f"QFrame#TaskCard {{ background-color: {bg}; border: 2px solid transparent; border-radius: 14px; }}")
+        QWidget.enterEvent(self, event)
+
+    def leaveEvent(self, a0):
+        if not self._long_pressed and not self._is_focus:
+            bg = ThemeManager().current_theme.card_bg
+            self.setStyleSheet(f"QFrame#TaskCard {{ background-color: {bg}; border: 2px solid transparent; border-radius: 14px; }}")
+        QWidget.leaveEvent(self, a0)
+
+
+def _build_board(widget_cls, cards: int) -> tuple[QWidget, list]:
+    board = QWidget()
+    board.setStyleSheet(ThemeManager().get_style_sheet())
+    grid = QGridLayout(board)
+    widgets = []
+    for i in range(cards):
+        w = widget_cls({"id": f"t{i}", "title": f"タスク {i}", "description": "説明テキスト"}, "現在のタスク")
+        grid.addWidget(w, i // 2, i % 2)
+        widgets.append(w)
+    board.resize(900, 120 * (cards // 2 + 1))
+    board.show()
+    QApplication.processEvents()
+    return board, widgets
+
+
+def _measure(app: QApplication, widgets: list, rounds: int) -> float:
+    """1 回の Enter+Leave（再描画まで）にかかる平均時間 [us] を返す。"""
+    events = 0
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        for w in widgets:
+            app.sendEvent(w, QEnterEvent(QPointF(5, 5), QPointF(5, 5), QPointF(5, 5)))
+            app.sendEvent(w, QEvent(QEvent.Type.Leave))
+            events += 1
+        app.processEvents()
+    return (time.perf_counter() - t0) / events * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cards", type=int, default=60)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    for label, cls in (("legacy (setStyleSheet)", LegacyTaskWidget), ("current (card_state)", TaskWidget)):
+        board, widgets = _build_board(cls, args.cards)
+        _measure(app, widgets, 2)  # ウォームアップ
+        us = _measure(app, widgets, args.rounds)
+        print(f"{label:<24} {us:9.1f} us per hover (enter+leave), {args.cards} cards")
+        board.close()
+        board.deleteLater()
+        app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
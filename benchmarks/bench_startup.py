@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: MIT
+"""コールドスタートのレイテンシ計測。
+
+ローカルのスタンドイン Tasks API サーバーに対して
+- time-to-service : service クライアント構築までの時間
+- time-to-first-list : さらにタスクリスト一覧とタスク先頭ページを取得するまでの時間
+を、ネットワーク経由のディスカバリと backend.build_tasks_service（同梱/キャッシュ）とで比較する。
+
+    python benchmarks/bench_startup.py [--runs 20] [--latency-ms 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import httplib2  # noqa: E402
+from googleapiclient.discovery import build  # noqa: E402
+
+import backend  # noqa: E402
+from fake_tasks_server import TASKLIST_ID, FakeTasksServer, make_tasks  # noqa: E402
+
+
+def _first_list(service) -> None:
+    service.tasklists().list(maxResults=100).execute()
+    service.tasks().list(tasklist=TASKLIST_ID, maxResults=100, showCompleted=False).execute()
+
+
+def _measure(label: str, runs: int, make_service) -> None:
+    to_service = []
+    to_list = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        service = make_service()
+        t1 = time.perf_counter()
+        _first_list(service)
+        t2 = time.perf_counter()
+        to_service.append((t1 - t0) * 1000)
+        to_list.append((t2 - t0) * 1000)
+    print(
+        f"{label:<28} time-to-service {statistics.median(to_service):8.2f} ms"
+        f"   time-to-first-list {statistics.median(to_list):8.2f} ms   (median of {runs})"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="疑似ネットワーク遅延（1 リクエストあたり）")
+    args = parser.parse_args()
+
+    doc = backend.load_discovery_document()
+    server = FakeTasksServer(make_tasks(300), latency_ms=args.latency_ms, discovery_doc=doc).start()
+    try:
+        endpoint = server.url
+        discovery_url = endpoint + "$discovery/rest?version={apiVersion}"
+
+        def network_discovery():
+            return build(
+                "tasks",
+                "v1",
+                http=httplib2.Http(),
+                discoveryServiceUrl=discovery_url,
+                static_discovery=False,
+                cache_discovery=False,
+                client_options={"api_endpoint": endpoint},
+            )
+
+        def backend_cold():
+            # プロセス内キャッシュを捨ててディスク/同梱版の読み込みから計測
+            backend._discovery_doc = None
+            return backend.build_tasks_service(None, http=httplib2.Http(), api_endpoint=endpoint)
+
+        def backend_warm():
+            return backend.build_tasks_service(None, http=httplib2.Http(), api_endpoint=endpoint)
+
+        print(f"latency={args.latency_ms} ms/request")
+        _measure("network discovery", args.runs, network_discovery)
+        _measure("backend (cold, offline doc)", args.runs, backend_cold)
+        _measure("backend (warm)", args.runs, backend_warm)
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+# SPDX-License-Identifier: MIT
+"""ベンチマーク用の Google Tasks API 代替ローカル HTTP サーバー。
+
+実 API と同じパス（tasks/v1/...）でタスクリスト/タスクを返す。
+バッチエンドポイント（POST /batch、multipart/mixed）も受け付け、中の各リクエストを個別に処理する。
+レイテンシの疑似付与、リクエスト数・送信バイト数の計測、タスクごとの失敗の注入（fail）ができる。
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from email.parser import Parser
+from http import HTTPStatus
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+TASKLIST_ID = "benchlist"
+
+
+def make_tasks(count: int, completed_ratio: float = 0.9) -> List[Dict[str, Any]]:
+    """実 API のレスポンスに近い形のダミータスクを生成する。"""
+    base = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    n_completed = int(count * completed_ratio)
+    tasks = []
+    for i in range(count):
+        updated = (base + timedelta(minutes=i)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        task_id = f"task{i:06d}"
+        t: Dict[str, Any] = {
+            "kind": "tasks#task",
+            "id": task_id,
+            "etag": f'"etag-{i}"',
+            "title": f"タスク {i}",
+            "updated": updated,
+            "selfLink": f"https://www.googleapis.com/tasks/v1/lists/{TASKLIST_ID}/tasks/{task_id}",
+            "position": f"{i:020d}",
+            "notes": f"メモ {i}",
+            "status": "needsAction",
+            "links": [],
+            "webViewLink": f"https://tasks.google.com/task/{task_id}",
+        }
+        if i < n_completed:
+            t["status"] = "completed"
+            t["completed"] = updated
+            t["hidden"] = True
+        tasks.append(t)
+    return tasks
+
+
+def _select_fields(obj: Any, fields: str) -> Any:
+    """fields パラメータ（"items(id,title),nextPageToken" 形式）の簡易実装。"""
+    def parse(spec: str) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        depth = 0
+        token = ""
+        for ch in spec + ",":
+            if ch == "(":
+                depth += 1
+            elif ch == ")":
+                depth -= 1
+            if ch == "," and depth == 0:
+                token = token.strip()
+                if "(" in token:
+                    name, inner = token.split("(", 1)
+                    result[name.strip()] = parse(inner[:-1])
+                elif token:
+                    result[token] = None
+                token = ""
+            else:
+                token += ch
+        return result
+
+    def apply(value: Any, spec: Optional[Dict[str, Any]]) -> Any:
+        if spec is None:
+            return value
+        if isinstance(value, list):
+            return [apply(v, spec) for v in value]
+        if isinstance(value, dict):
+            return {k: apply(value[k], sub) for k, sub in spec.items() if k in value}
+        return value
+
+    return apply(obj, parse(fields))
+
+
+class FakeTasksServer:
+    """スレッド上で動くスタンドイン Tasks API サーバー。"""
+
+    def __init__(self, tasks: List[Dict[str, Any]], latency_ms: float = 0.0, discovery_doc: Optional[Dict[str, Any]] = None):
+        self.tasks = tasks
+        self.latency_ms = latency_ms
+        self.discovery_doc = discovery_doc
+        self.request_count = 0
+        self.bytes_sent = 0
+        # タスク ID → 次の PATCH で返すエラーステータスの列（先頭から 1 つずつ消費する）
+        self.failures: Dict[str, List[int]] = {}
+        self._stats_lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        assert self._httpd is not None
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "FakeTasksServer":
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):  # noqa: A002
+                pass
+
+            def do_GET(self):
+                server._handle(self, "GET")
+
+            def do_PATCH(self):
+                server._handle(self, "PATCH")
+
+            def do_POST(self):
+                server._handle(self, "POST")
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def fail(self, task_id: str, *statuses: int) -> None:
+        """task_id への PATCH に、指定したステータスを順に返させる（使い切ったら成功する）。"""
+        with self._stats_lock:
+            self.failures.setdefault(task_id, []).extend(statuses)
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self.request_count = 0
+            self.bytes_sent = 0
+
+    def _send_json(self, handler: BaseHTTPRequestHandler, status: int, obj: Any) -> None:
+        body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json; charset=UTF-8")
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+        with self._stats_lock:
+            self.bytes_sent += len(body)
+
+    def _handle(self, handler: BaseHTTPRequestHandler, method: str) -> None:
+        with self._stats_lock:
+            self.request_count += 1
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000.0)
+        url = urlparse(handler.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        path = url.path
+        length = int(handler.headers.get("Content-Length") or 0)
+        payload = handler.rfile.read(length) if length else b""
+
+        if path.endswith("/$discovery/rest") and self.discovery_doc is not None:
+            self._send_json(handler, 200, self.discovery_doc)
+            return
+        if path.endswith("/batch") and method == "POST":
+            self._handle_batch(handler, payload)
+            return
+        status, body = self._route(method, path, query, payload)
+        self._send_json(handler, status, body)
+
+    def _route(self, method: str, path: str, query: Dict[str, str], payload: bytes) -> Tuple[int, Any]:
+        """1 件のリクエストを処理して (ステータス, 本文) を返す。"""
+        not_found = (404, {"error": {"code": 404, "message": "Not Found"}})
+        if path.endswith("/users/@me/lists") or path.endswith("/users/%40me/lists"):
+            body: Any = {"kind": "tasks#taskLists", "items": [{"kind": "tasks#taskList", "id": TASKLIST_ID, "title": "Bench"}]}
+        elif path.endswith(f"/lists/{TASKLIST_ID}/tasks") and method == "GET":
+            body = self._list_tasks(query)
+        elif f"/lists/{TASKLIST_ID}/tasks/" in path and method == "PATCH":
+            task_id = path.rsplit("/", 1)[-1]
+            with self._stats_lock:
+                queued = self.failures.get(task_id)
+                injected = queued.pop(0) if queued else None
+            if injected is not None:
+                return injected, {"error": {"code": injected, "message": HTTPStatus(injected).phrase}}
+            body = self._patch_task(task_id, json.loads(payload or b"{}"))
+            if body is None:
+                return not_found
+        else:
+            return not_found
+        fields = query.get("fields")
+        if fields:
+            body = _select_fields(body, fields)
+        return 200, body
+
+    def _handle_batch(self, handler: BaseHTTPRequestHandler, payload: bytes) -> None:
+        """multipart/mixed のバッチリクエストを分解して処理し、同じ形式で結果を返す。"""
+        content_type = handler.headers.get("Content-Type", "")
+        message = Parser().parsestr(f"Content-Type: {content_type}\r\n\r\n" + payload.decode("utf-8"))
+        boundary = f"batch_{uuid.uuid4().hex}"
+        out: List[str] = []
+        for part in message.get_payload():
+            content_id = (part["Content-ID"] or "").strip()
+            request_line, _, rest = part.get_payload().lstrip().partition("\n")
+            method, target = request_line.split(" ")[:2]
+            # ヘッダーと本文は空行で区切られる
+            sep = "\r\n\r\n" if "\r\n\r\n" in rest else "\n\n"
+            _headers, _, body_text = rest.partition(sep)
+            url = urlparse(target)
+            query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            status, body = self._route(method, url.path, query, body_text.strip().encode("utf-8"))
+            text = json.dumps(body, ensure_ascii=False)
+            out.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id.strip('<>')}>\r\n\r\n"
+                f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                "Content-Type: application/json; charset=UTF-8\r\n"
+                f"Content-Length: {len(text.encode('utf-8'))}\r\n\r\n"
+                f"{text}\r\n"
+            )
+        out.append(f"--{boundary}--\r\n")
+        data = "".join(out).encode("utf-8")
+        handler.send_response(200)
+        handler.send_header("Content-Type", f"multipart/mixed; boundary={boundary}")
+        handler.send_header("Content-Length", str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
+        with self._stats_lock:
+            self.bytes_sent += len(data)
+
+    def _list_tasks(self, query: Dict[str, str]) -> Dict[str, Any]:
+        show_completed = query.get("showCompleted", "true") == "true"
+        show_hidden = query.get("showHidden", "false") == "true"
+        updated_min = query.get("updatedMin")
+        completed_min = query.get("completedMin")
+        completed_max = query.get("completedMax")
+        max_results = min(100, int(query.get("maxResults", "20")))
+        start = int(query.get("pageToken") or 0)
+
+        def visible(t: Dict[str, Any]) -> bool:
+            if t.get("status") == "completed":
+                if not show_completed:
+                    return False
+                if t.get("hidden") and not show_hidden:
+                    return False
+                if completed_min and (t.get("completed") or "") < completed_min:
+                    return False
+                if completed_max and (t.get("completed") or "") >= completed_max:
+                    return False
+            elif completed_min or completed_max:
+                # 完了日時で絞り込むと未完了タスクは含まれない
+                return False
+            if updated_min and t["updated"] < updated_min:
+                return False
+            return True
+
+        matched = [t for t in self.tasks if visible(t)]
+        page = matched[start:start + max_results]
+        body: Dict[str, Any] = {"kind": "tasks#tasks", "etag": '"list-etag"', "items": page}
+        if start + max_results < len(matched):
+            body["nextPageToken"] = str(start + max_results)
+        return body
+
+    def _patch_task(self, task_id: str, patch: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        for t in self.tasks:
+            if t["id"] == task_id:
+                t.update(patch)
+                if t.get("completed") is None:
+                    t.pop("completed", None)
+                t["updated"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+                return t
+        return None
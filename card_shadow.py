@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: MIT
+"""カードの影描画（QGraphicsDropShadowEffect の代替）。
+
+角丸矩形の影を一度だけぼかして 9-slice 用のピクスマップとしてキャッシュし、
+各カードは自分の paintEvent でそれを引き伸ばして描くだけにする。
+ぼかし処理は（影の色 × 段階 × 角丸半径 × devicePixelRatio）ごとに 1 回しか走らない。
+9-slice なのでカードのサイズごとにピクスマップを作る必要はない。
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, Tuple
+
+from PyQt6.QtCore import QMargins, QRect, QRectF, Qt
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap
+from PyQt6.QtWidgets import QGraphicsBlurEffect, QGraphicsPixmapItem, QGraphicsScene
+
+CARD_RADIUS = 14
+
+ELEVATION_NORMAL = "normal"
+ELEVATION_LIFTED = "lifted"
+
+# 段階ごとの (ぼかし半径, Y オフセット)
+# 通常はガイド準拠（Blur 8px, Offset 3px）、持ち上げ時は少し強調するが控えめに（Lift Effect）
+ELEVATIONS: Dict[str, Tuple[int, int]] = {
+    ELEVATION_NORMAL: (8, 3),
+    ELEVATION_LIFTED: (10, 5),
+}
+
+# カード本体の外側に確保する影用の余白（左, 上, 右, 下）。テーマの QFrame#TaskCard の margin と一致させる。
+# 影はカード本体から左右に blur、上に blur - offset、下に blur + offset はみ出すので、
+# どの段階の影も切れないよう最大値から求める
+CARD_SHADOW_MARGINS: Tuple[int, int, int, int] = (
+    max(blur for blur, _offset in ELEVATIONS.values()),
+    max(max(0, blur - offset) for blur, offset in ELEVATIONS.values()),
+    max(blur for blur, _offset in ELEVATIONS.values()),
+    max(blur + offset for blur, offset in ELEVATIONS.values()),
+)
+
+_RGBA_RE = re.compile(r"rgba?\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*(?:,\s*(\d+(?:\.\d+)?)\s*)?\)")
+
+_cache: Dict[Tuple[str, int, int, float], Tuple[QPixmap, int]] = {}
+
+
+def parse_color(value: str) -> QColor:
+    """"#RRGGBB" などに加えて CSS 形式の "rgba(r, g, b, a)" も受け付ける。"""
+    m = _RGBA_RE.fullmatch(value.strip())
+    if not m:
+        return QColor(value)
+    r, g, b, a = m.groups()
+    alpha = 255 if a is None else float(a)
+    # rgba() のアルファは 0-255 の整数（テーマ定義）か 0-1 の小数
+    if a is not None and "." in a:
+        alpha = alpha * 255
+    return QColor(int(r), int(g), int(b), int(max(0, min(255, alpha))))
+
+
+def card_body_rect(rect: QRect) -> QRect:
+    """ウィジェット全体の矩形から、影用余白を除いたカード本体の矩形を返す。"""
+    left, top, right, bottom = CARD_SHADOW_MARGINS
+    return rect.marginsRemoved(QMargins(left, top, right, bottom))
+
+
+def _render_shadow(color: QColor, blur: int, radius: int, dpr: float) -> Tuple[QPixmap, int]:
+    """9-slice 用のぼかし済み影ピクスマップと、角タイルの大きさ（論理 px）を返す。"""
+    # 角タイルは角丸とぼかしの影響範囲をすべて含む大きさ。中央 2px は辺の一様な部分
+    tile = 2 * blur + radius
+    size = 2 * tile + 2
+    px = int(round(size * dpr))
+
+    base = QImage(px, px, QImage.Format.Format_ARGB32_Premultiplied)
+    base.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(base)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.scale(dpr, dpr)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(color)
+    painter.drawRoundedRect(QRectF(blur, blur, size - 2 * blur, size - 2 * blur), radius, radius)
+    painter.end()
+
+    # ぼかしはキャッシュ作成時の 1 回だけ（QGraphicsScene 上でオフスクリーン描画）
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(QPixmap.fromImage(base))
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(blur * dpr)
+    effect.setBlurHints(QGraphicsBlurEffect.BlurHint.QualityHint)
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+
+    out = QImage(px, px, QImage.Format.Format_ARGB32_Premultiplied)
+    out.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(out)
+    scene.render(painter, QRectF(0, 0, px, px), QRectF(0, 0, px, px))
+    painter.end()
+
+    pixmap = QPixmap.fromImage(out)
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap, tile
+
+
+def shadow_pixmap(color_value: str, elevation: str, dpr: float) -> Tuple[QPixmap, int, int, int]:
+    """キャッシュ済みの影ピクスマップを返す。戻り値は (pixmap, 角タイル, ぼかし半径, Y オフセット)。"""
+    blur, offset = ELEVATIONS[elevation]
+    key = (color_value, blur, CARD_RADIUS, dpr)
+    cached = _cache.get(key)
+    if cached is None:
+        cached = _render_shadow(parse_color(color_value), blur, CARD_RADIUS, dpr)
+        _cache[key] = cached
+    pixmap, tile = cached
+    return pixmap, tile, blur, offset
+
+
+def draw_card_shadow(painter: QPainter, body: QRect, color_value: str, elevation: str, dpr: float) -> None:
+    """カード本体 body の下に影を 9-slice で描画する。"""
+    pixmap, tile, blur, offset = shadow_pixmap(color_value, elevation, dpr)
+    target = QRectF(body.adjusted(-blur, -blur + offset, blur, blur + offset))
+    size = pixmap.width() / dpr
+
+    # カードが小さい場合は角タイルを縮める
+    t = min(float(tile), target.width() / 2, target.height() / 2)
+    src_t = tile * dpr
+    src_mid = (size - 2 * tile) * dpr
+    xs_src = (0.0, src_t, src_t + src_mid)
+    ws_src = (src_t, src_mid, src_t)
+    xs_dst = (target.left(), target.left() + t, target.right() - t)
+    ws_dst = (t, target.width() - 2 * t, t)
+    ys_dst = (target.top(), target.top() + t, target.bottom() - t)
+    hs_dst = (t, target.height() - 2 * t, t)
+    for row in range(3):
+        if hs_dst[row] <= 0:
+            continue
+        for col in range(3):
+            if ws_dst[col] <= 0:
+                continue
+            painter.drawPixmap(
+                QRectF(xs_dst[col], ys_dst[row], ws_dst[col], hs_dst[row]),
+                pixmap,
+                QRectF(xs_src[col], xs_src[row], ws_src[col], ws_src[row]),
+            )
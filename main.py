@@ -1,11 +1,11 @@
 # SPDX-License-Identifier: MIT
 
+import bisect
 import sys
 import typing
-import threading
 import json
-import os
-from datetime import datetime
+import threading
+import time
 from PyQt6.QtWidgets import (
     QApplication,
     QLabel,
@@ -14,12 +14,12 @@ from PyQt6.QtWidgets import (
     QWidget,
     QFrame,
     QSizePolicy,
-    QGridLayout,
+    QScrollArea,
     QMessageBox,
     QGraphicsOpacityEffect,
     QPushButton,
 )
-from PyQt6.QtGui import QPalette, QColor, QDrag, QPixmap, QMouseEvent
+from PyQt6.QtGui import QPalette, QDrag, QFontMetrics, QPixmap, QMouseEvent, QPainter
 from PyQt6.QtCore import (
     Qt,
     pyqtSignal,
@@ -28,11 +28,21 @@ from PyQt6.QtCore import (
     QPropertyAnimation,
     QPoint,
     QEvent,
-    QUrl,
+    QRect,
+    QAbstractListModel,
+    QModelIndex,
 )
-from PyQt6.QtWidgets import QGraphicsDropShadowEffect
-from PyQt6.QtMultimedia import QSoundEffect, QMediaPlayer, QAudioOutput
 import backend
+import card_shadow
+from asset_cache import AssetCache, asset_path
+from sound_engine import SoundEngine
+import outbox
+import snapshot
+from perf_overlay import PerfMonitor, perf_span
+from stall_watchdog import StallWatchdog
+from sync_worker import SyncWorker
+from task_diff import SectionChanges, diff_sections, task_key
+from task_store import SectionAccumulator, TaskRecord, TaskStore
 from theme_manager import ThemeManager, LIGHT_THEME, DARK_THEME
 
 try:
@@ -69,39 +79,73 @@ class TaskWidget(QFrame):
         self._hint_effect: QGraphicsOpacityEffect | None = None
         self._press_active = False
         self._is_focus = False
-        self._focus_shadow: QGraphicsDropShadowEffect | None = None
-        
+        self._dragging = False
+        self._hovered = False
+        # refresh_ui の差分更新で再利用される。プールに戻されている間は False
+        self.in_use = True
+
+        task_layout = QVBoxLayout()
+        task_layout.setContentsMargins(16, 16, 16, 16)
+
+        # タイトル
+        self._title_label = QLabel()
+        self._title_label.setObjectName("TaskTitle")
+        self._title_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        self._title_label.setWordWrap(True)
+        task_layout.addWidget(self._title_label)
+
+        # 説明（空の場合は非表示）
+        self._desc_label = QLabel()
+        self._desc_label.setObjectName("TaskDesc")
+        self._desc_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        self._desc_label.setWordWrap(True)
+        task_layout.addWidget(self._desc_label)
+
+        # スペーサーで上詰め
+        task_layout.addStretch()
+        self.setLayout(task_layout)
+        self.set_task(task_data, section)
+
         # 初期スタイル適用
         self._update_style()
-        self._apply_normal_shadow()
 
-    def _apply_normal_shadow(self):
-        try:
-            shadow = QGraphicsDropShadowEffect(self)
-            # テーマに合わせて調整（ガイド準拠：Blur 8px, Offset 3px, Alpha ~15%） #2
-            shadow.setBlurRadius(8)
-            shadow.setOffset(0, 3)
-            shadow.setColor(QColor(ThemeManager().current_theme.shadow))
-            self.setGraphicsEffect(shadow)
-        except Exception:
-            pass
+    def set_task(self, task_data: dict, section: str) -> None:
+        """表示するタスクを差し替える。変わったテキストだけを更新する。"""
+        self.task_data = task_data
+        self.section = section
+        title = task_data.get("title", "")
+        if self._title_label.text() != title:
+            self._title_label.setText(title)
+        desc = task_data.get("description") or ""
+        if self._desc_label.text() != desc:
+            self._desc_label.setText(desc)
+        if self._desc_label.isHidden() == bool(desc):
+            self._desc_label.setVisible(bool(desc))
+
+    def paintEvent(self, a0):
+        # 影はカード本体の外側（QSS の margin 分の透明領域）にキャッシュ済みピクスマップで描く
+        # QGraphicsDropShadowEffect のようにカードごとのオフスクリーン描画・ぼかしは行わない #2
+        elevation = card_shadow.ELEVATION_LIFTED if self._long_pressed else card_shadow.ELEVATION_NORMAL
+        painter = QPainter(self)
+        card_shadow.draw_card_shadow(
+            painter,
+            card_shadow.card_body_rect(self.rect()),
+            ThemeManager().current_theme.shadow,
+            elevation,
+            self.devicePixelRatioF(),
+        )
+        painter.end()
+        super().paintEvent(a0)
 
     def enterEvent(self, event):
-        if not self._long_pressed and not self._is_focus:
-            # ホバー時はわずかに明るく（QSSで十分機能しない場合のフォールバック）
-            # ThemeManagerのget_style_sheetですでに :hover を定義しているので
-            # ここでは何もしない、あるいはQSSが効かない場合に備えて手動設定する
-            # QFrameはQSSの:hoverが効きにくい場合があるためここで補完
-            is_dark = ThemeManager().is_dark
-            bg = "#252525" if is_dark else "#FAFAFA"
-            self.setStyleSheet(f"QFrame#TaskCard {{ background-color: {bg}; border: 2px solid transparent; border-radius: 14px; }}")
+        # QFrameはQSSの:hoverが効きにくいため、card_state プロパティでホバー状態を表す
+        self._hovered = True
+        self._update_style()
         super().enterEvent(event)
 
     def leaveEvent(self, a0):
-        if not self._long_pressed and not self._is_focus:
-            # 元に戻す
-            bg = ThemeManager().current_theme.card_bg
-            self.setStyleSheet(f"QFrame#TaskCard {{ background-color: {bg}; border: 2px solid transparent; border-radius: 14px; }}")
+        self._hovered = False
+        self._update_style()
         super().leaveEvent(a0)
 
     def mousePressEvent(self, a0):
@@ -134,23 +178,11 @@ class TaskWidget(QFrame):
 
     def _on_long_press(self) -> None:
         self._long_pressed = True
-        # モダンな浮き上がり効果 + 差し色背景
+        # モダンな浮き上がり効果 + 差し色背景（テーマの QFrame#TaskCard[card_state="lifted"]）
         try:
-            accent = ThemeManager().current_theme.accent
-            c = QColor(accent)
-            # Alpha 25 (~10%)
-            bg_color = f"rgba({c.red()}, {c.green()}, {c.blue()}, 25)"
-            
-            # ボーダーもアクセントにして「掴んでいる」感を出す
-            self.setStyleSheet(f"QFrame#TaskCard {{ background-color: {bg_color}; border: 2px solid {accent}; border-radius: 14px; }}")
-
-            # 影を少し強調するが、ガイドに従い控えめに（Lift Effect）
-            shadow = QGraphicsDropShadowEffect(self)
-            shadow.setBlurRadius(30)
-            shadow.setOffset(0, 10)
-            shadow.setColor(QColor(ThemeManager().current_theme.shadow))
-            self.setGraphicsEffect(shadow)
-            
+            # 影も持ち上げ用の段階に切り替わる（paintEvent で描画）
+            self._update_style()
+
             # ヒント矢印を表示（少し遅らせて）
             self._hint_timer.start(150)
 
@@ -170,10 +202,9 @@ class TaskWidget(QFrame):
         self._hint_label = QLabel(self)
         self._hint_label.setObjectName("HintArrow")
         
-        # 矢印画像の読み込み
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        img_path = os.path.join(base_dir, "assets", "yajirushi.png")
-        pix = QPixmap(img_path)
+        # 矢印画像（起動時に読み込み済みのキャッシュから取得）
+        ui_scale = getattr(self.window(), "ui_scale", 1.0)
+        pix = AssetCache().pixmap("yajirushi.png", ui_scale, self.devicePixelRatioF())
         
         if not pix.isNull():
             # 画像がある場合
@@ -225,16 +256,17 @@ class TaskWidget(QFrame):
         drag.setHotSpot(self._press_pos if self._press_pos else QPoint(pixmap.width() // 2, pixmap.height() // 2))
 
         # ドラッグ開始時に自分自身を隠すことで「持ち上げた」感を出す
+        self._dragging = True
         self.hide()
 
         result = drag.exec(Qt.DropAction.MoveAction)
+        self._dragging = False
         
         # ドラッグ終了後の処理
         self._cancel_press()
-        # 万が一ドロップ先で適切に処理されなかった場合（移動せずキャンセルされた場合など）は再表示
-        # ただし移動成功時は refresh_ui で再描画されるため、ここではとりあえず再表示して問題ない
-        self.show()
-        self._apply_normal_shadow()
+        # 移動せずキャンセルされた場合は再表示。移動成功時は refresh_ui でプールへ戻されているので表示しない
+        if self.in_use:
+            self.show()
 
     def _cancel_press(self) -> None:
         self._press_timer.stop()
@@ -252,46 +284,48 @@ class TaskWidget(QFrame):
         self._long_pressed = False
         self._press_active = False
         
-        # ドラッグ終了後は通常のスタイルに戻す
-        # フォーカスされている場合はフォーカス用のボーダーを維持
-        if self._is_focus:
-            # set_focus_enabledで設定されたスタイルに戻す(style polish)
-            self.style().unpolish(self)
-            self.style().polish(self)
-            self._apply_normal_shadow()
-        else:
-            # 通常状態に戻す
-            bg = ThemeManager().current_theme.card_bg
-            # QSSのhoverなどが効くように styleSheet をクリアするか、明示的に設定
-            # ここでは明示的に戻す（QSSとの競合を避けるため）
-            self.setStyleSheet(f"QFrame#TaskCard {{ background-color: {bg}; border: 2px solid transparent; border-radius: 14px; }}")
-            self._apply_normal_shadow()
+        # ドラッグ終了後は通常のスタイルに戻す（フォーカス枠は is_focus プロパティ側で維持される）
+        self._update_style()
+
+    def apply_theme(self) -> None:
+        """テーマ切替時に影を描き直す（背景/枠線はウィンドウのスタイルシートに従う）。"""
+        self.update()
 
     def set_focus_enabled(self, enabled: bool) -> None:
         self._is_focus = enabled
         self.setProperty("is_focus", enabled)
-        
-        # フォーカス時はアクセントカラーの枠線
-        if enabled:
-            accent = ThemeManager().current_theme.focus_border
-            bg = ThemeManager().current_theme.card_bg
-            self.setStyleSheet(f"QFrame#TaskCard {{ background-color: {bg}; border: 2px solid {accent}; border-radius: 14px; }}")
-        else:
-            # 通常
-            bg = ThemeManager().current_theme.card_bg
-            self.setStyleSheet(f"QFrame#TaskCard {{ background-color: {bg}; border: 2px solid transparent; border-radius: 14px; }}")
+        # フォーカス時はアクセントカラーの枠線（テーマの QFrame#TaskCard[is_focus="true"]）
+        self._update_style(repolish=True)
 
-        self.style().unpolish(self)
-        self.style().polish(self)
-        
-        # 子要素のラベルなども更新
-        for child in self.findChildren(QLabel):
+        # 子要素のラベルも is_focus に応じたフォントサイズにする
+        for child in (self._title_label, self._desc_label):
             child.setProperty("is_focus", enabled)
             child.style().unpolish(child)
             child.style().polish(child)
 
-    def _update_style(self) -> None:
-        pass # Stylesheet applied globally or via ThemeManager
+    def _card_state(self) -> str:
+        if self._long_pressed:
+            return "lifted"
+        if self._press_active:
+            return "pressed"
+        if self._hovered and not self._is_focus:
+            return "hover"
+        return "normal"
+
+    def _update_style(self, repolish: bool = False) -> None:
+        """現在の状態を card_state プロパティへ反映する。
+
+        見た目はテーマのスタイルシート（QFrame#TaskCard[card_state=...]）で定義済みなので、
+        ここでは CSS を生成・解析せず、解析済みのルールを再マッチさせるだけ。
+        """
+        state = self._card_state()
+        if self.property("card_state") == state and not repolish:
+            return
+        self.setProperty("card_state", state)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+        self.update()
 
 
 class SectionWidget(QWidget):
@@ -388,12 +422,437 @@ class SectionWidget(QWidget):
             a0.ignore()
 
 
+class TaskListModel(QAbstractListModel):
+    """「現在のタスク」ボードのモデル。タスク（TaskRecord）をそのまま保持する。"""
+
+    TaskRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tasks: list[dict] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._tasks)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._tasks)):
+            return None
+        task = self._tasks[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return task.get("title")
+        if role == self.TaskRole:
+            return task
+        return None
+
+    def task(self, row: int) -> dict:
+        return self._tasks[row]
+
+    def set_tasks(self, tasks: list) -> None:
+        """タスク一覧を差し替える。並びが同じなら変わった行だけ dataChanged を出す。"""
+        tasks = list(tasks)
+        if [task_key(t) for t in self._tasks] != [task_key(t) for t in tasks]:
+            self.beginResetModel()
+            self._tasks = tasks
+            self.endResetModel()
+            return
+        changed = [i for i, (a, b) in enumerate(zip(self._tasks, tasks)) if a is not b]
+        self._tasks = tasks
+        if changed:
+            self.dataChanged.emit(self.index(changed[0]), self.index(changed[-1]))
+
+
+class VirtualTaskBoard(QScrollArea):
+    """TaskListModel を 2 カラムのカードで表示する仮想化ビュー。
+
+    先頭（フォーカスタスク）は横幅いっぱい、以降は 2 カラムで並べる。
+    カードの高さはタイトル/説明の折り返しに合わせて求め（CARD_HEIGHT / FOCUS_CARD_HEIGHT は最小値）、
+    行ごとの上端を表にしておく。表示範囲の行は二分探索で求め、その行のカードだけ TaskWidget を割り当てる。
+    範囲外になった TaskWidget はプールへ戻して再利用する。
+    """
+
+    POOL_MAX = 32
+    SPACING = 16
+    CARD_HEIGHT = 132
+    FOCUS_CARD_HEIGHT = 168
+    OVERSCAN_PX = 200
+
+    def __init__(self, model: TaskListModel, section: str, ui_scale: float = 1.0, parent=None):
+        super().__init__(parent)
+        self._model = model
+        self._section = section
+        self._card_h = int(self.CARD_HEIGHT * ui_scale)
+        self._focus_h = int(self.FOCUS_CARD_HEIGHT * ui_scale)
+        self._widgets: dict = {}
+        self._pool: list[TaskWidget] = []
+        # 行の配置表（カード本体の座標系）。_row_tops[0] はフォーカスカード、以降は 2 カラムの各行
+        self._layout_width = -1
+        self._row_tops: list[int] = []
+        self._row_heights: list[int] = []
+        # 高さの計測用（表示しないカード）。(幅, フォーカス) → 折り返し計算に使う寸法
+        self._probes: dict = {}
+        self._metrics: dict = {}
+        self._height_cache: dict = {}
+
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setWidgetResizable(True)
+        self._canvas = QWidget()
+        self.setWidget(self._canvas)
+
+        self.verticalScrollBar().valueChanged.connect(self._update_visible)
+        model.modelReset.connect(self.relayout)
+        model.rowsInserted.connect(self.relayout)
+        model.rowsRemoved.connect(self.relayout)
+        model.layoutChanged.connect(self.relayout)
+        # テキストが変わると高さも変わり得るので配置から計算し直す（高さはキャッシュ済み）
+        model.dataChanged.connect(self.relayout)
+
+    # --- 高さの計算 ---
+    def _probe(self, focus: bool) -> TaskWidget:
+        probe = self._probes.get(focus)
+        if probe is None:
+            probe = TaskWidget({"title": "", "description": ""}, self._section)
+            probe.setParent(self._canvas)
+            probe.hide()
+            if focus:
+                probe.set_focus_enabled(True)
+            self._probes[focus] = probe
+        return probe
+
+    def _card_metrics(self, widget_w: int, focus: bool) -> tuple:
+        """幅 widget_w のカードについて (文字の幅, 上下の余白, 行間, タイトル/説明の QFontMetrics) を返す。"""
+        key = (widget_w, focus)
+        metrics = self._metrics.get(key)
+        if metrics is not None:
+            return metrics
+        probe = self._probe(focus)
+        probe.set_task({"title": "x", "description": "x"}, self._section)
+        probe.ensurePolished()
+        probe._title_label.ensurePolished()
+        probe._desc_label.ensurePolished()
+        probe.setGeometry(0, 0, widget_w, 10_000)
+        layout = probe.layout()
+        layout.activate()
+        title = probe._title_label
+        margins = layout.contentsMargins()
+        contents = probe.contentsRect()
+        chrome = contents.top() + margins.top() + margins.bottom() + (probe.height() - contents.bottom() - 1)
+        metrics = (
+            max(1, title.contentsRect().width()),
+            chrome,
+            layout.spacing(),
+            QFontMetrics(title.font()),
+            QFontMetrics(probe._desc_label.font()),
+        )
+        self._metrics[key] = metrics
+        return metrics
+
+    def _card_height(self, task, widget_w: int, focus: bool) -> int:
+        """タスクのテキストを折り返して切れずに収まるカード本体の高さ。"""
+        title = task.get("title") or ""
+        desc = task.get("description") or ""
+        key = (title, desc, widget_w, focus)
+        h = self._height_cache.get(key)
+        if h is not None:
+            return h
+        text_w, chrome, spacing, title_fm, desc_fm = self._card_metrics(widget_w, focus)
+        flags = int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap)
+        h = chrome + title_fm.boundingRect(QRect(0, 0, text_w, 100_000), flags, title).height()
+        if desc:
+            h += spacing + desc_fm.boundingRect(QRect(0, 0, text_w, 100_000), flags, desc).height()
+        left, top, right, bottom = card_shadow.CARD_SHADOW_MARGINS
+        h = max(self._focus_h if focus else self._card_h, h - top - bottom)
+        self._height_cache[key] = h
+        return h
+
+    def _build_row_table(self, width: int) -> None:
+        """全行の上端と高さを求める（2 カラムの行は高い方のカードに揃える）。"""
+        if width != self._layout_width:
+            # 幅が変わると折り返しも変わるので、前の幅で測った高さは捨てる
+            self._height_cache.clear()
+            self._metrics.clear()
+        left, _top, right, _bottom = card_shadow.CARD_SHADOW_MARGINS
+        body_w = width - left - right
+        col_w = (body_w - self.SPACING) // 2
+        rows = self._model.rowCount()
+        tops: list[int] = []
+        heights: list[int] = []
+        if rows:
+            tops.append(0)
+            heights.append(self._card_height(self._model.task(0), body_w + left + right, True))
+            y = heights[0] + self.SPACING
+            for row in range(1, rows, 2):
+                h = self._card_height(self._model.task(row), col_w + left + right, False)
+                if row + 1 < rows:
+                    h = max(h, self._card_height(self._model.task(row + 1), col_w + left + right, False))
+                tops.append(y)
+                heights.append(h)
+                y += h + self.SPACING
+        self._layout_width = width
+        self._row_tops = tops
+        self._row_heights = heights
+
+    def _item_rect(self, row: int, width: int) -> QRect:
+        """カードの配置矩形（カード本体の外側に影用の余白を含む）。"""
+        left, top, right, bottom = card_shadow.CARD_SHADOW_MARGINS
+        body = self._body_rect(row, width - left - right).translated(left, top)
+        return body.adjusted(-left, -top, right, bottom)
+
+    def _body_rect(self, row: int, width: int) -> QRect:
+        if row == 0:
+            return QRect(0, 0, width, self._row_heights[0])  # colspan 2
+        sp = self.SPACING
+        col_w = (width - sp) // 2
+        r, c = divmod(row - 1, 2)
+        return QRect(c * (col_w + sp), self._row_tops[r + 1], col_w, self._row_heights[r + 1])
+
+    def _content_height(self) -> int:
+        if not self._row_tops:
+            return 0
+        _left, top, _right, bottom = card_shadow.CARD_SHADOW_MARGINS
+        return self._row_tops[-1] + self._row_heights[-1] + top + bottom
+
+    def _visible_rows(self) -> range:
+        rows = self._model.rowCount()
+        if rows == 0 or not self._row_tops:
+            return range(0)
+        top = max(0, self.verticalScrollBar().value() - self.OVERSCAN_PX)
+        bottom = self.verticalScrollBar().value() + self.viewport().height() + self.OVERSCAN_PX
+        # 上端が bottom 以下の最後の行まで、下端が top 以上の最初の行から
+        first_r = max(0, bisect.bisect_right(self._row_tops, top) - 1)
+        if self._row_tops[first_r] + self._row_heights[first_r] < top:
+            first_r += 1
+        last_r = max(0, bisect.bisect_right(self._row_tops, bottom) - 1)
+        first = 0 if first_r == 0 else 2 * first_r - 1
+        last = 0 if last_r == 0 else 2 * last_r
+        return range(first, min(rows, last + 1))
+
+    def relayout(self, *args) -> None:
+        self._build_row_table(self.viewport().width())
+        self._canvas.setMinimumHeight(self._content_height())
+        self._update_visible()
+
+    def resizeEvent(self, a0):
+        super().resizeEvent(a0)
+        if self.viewport().width() != self._layout_width:
+            self.relayout()
+        else:
+            self._update_visible()
+
+    def _acquire(self, task: dict) -> TaskWidget:
+        if self._pool:
+            w = self._pool.pop()
+            w.in_use = True
+            w.set_task(task, self._section)
+            return w
+        w = TaskWidget(task, self._section)
+        w.setParent(self._canvas)
+        return w
+
+    def _release(self, w: TaskWidget) -> None:
+        w.in_use = False
+        w.hide()
+        # 非表示にすると leaveEvent が来ないのでホバー状態もここで解除する
+        w._hovered = False
+        w._cancel_press()
+        if w._is_focus:
+            w.set_focus_enabled(False)
+        if len(self._pool) < self.POOL_MAX:
+            self._pool.append(w)
+        else:
+            w.setParent(None)
+            w.deleteLater()
+
+    def _update_visible(self, *args) -> None:
+        """表示範囲のカードだけを割り当て・配置する（タスクキーで既存カードを使い回す）。"""
+        width = self.viewport().width()
+        old_widgets = self._widgets
+        new_widgets: dict = {}
+        for row in self._visible_rows():
+            task = self._model.task(row)
+            key = task_key(task)
+            if key in new_widgets:
+                # 同じキーのタスク（重複タイトルのローカルタスク等）は別カードにする
+                key = (key, row)
+            w = old_widgets.pop(key, None)
+            if w is None:
+                w = self._acquire(task)
+            elif w.task_data is not task:
+                w.set_task(task, self._section)
+            new_widgets[key] = w
+
+            # フォーカスタスクの強調（先頭を採用）
+            is_focus = row == 0
+            if w._is_focus != is_focus:
+                w.set_focus_enabled(is_focus)
+            rect = self._item_rect(row, width)
+            if w.geometry() != rect:
+                w.setGeometry(rect)
+            if w.isHidden() and not w._dragging:
+                w.show()
+
+        # 範囲外/不要になったカードはプールへ
+        for w in old_widgets.values():
+            self._release(w)
+        self._widgets = new_widgets
+
+    def apply_theme(self) -> None:
+        """テーマ切替時に、表示中/プール中のカードへテーマ色を付け直す。フォントが変わり得るので高さも測り直す。"""
+        for w in list(self._widgets.values()) + self._pool + list(self._probes.values()):
+            w.apply_theme()
+        self._metrics.clear()
+        self._height_cache.clear()
+        self.relayout()
+
+
+class CompletionOverlay(QWidget):
+    """完了時のポップアップと流れ効果を表示する常設のオーバーレイ。
+
+    ウィジェットとアニメーションは最初に一度だけ作っておき、完了のたびに
+    テキストと位置を差し替えてアニメーションを最初からやり直す。
+    連続して完了しても重ね表示にはならず、生きているウィジェット数は一定。
+    """
+
+    def __init__(self, parent: QWidget):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setStyleSheet("QWidget { background: transparent; }")
+
+        # 背景に半透明白を敷く（他のタスクを少し透けさせつつ、達成感を演出）
+        self._flow = QWidget(self)
+        self._flow.setStyleSheet("QWidget { background-color: rgba(255,255,255,40); }") # 半透明白
+        # フローライン（少し控えめに）
+        self._bar = QWidget(self._flow)
+        self._bar.setStyleSheet("QWidget { background-color: rgba(100,255,100,80); }") # 緑っぽく変更
+
+        # チェックマーク（縦幅40-50%程度に縮小、フェードアウトを早く）
+        self._check = QLabel("✓", self)
+        self._check.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._check.setStyleSheet("QLabel { color: #2E7D32; font-size: 64px; font-weight: bold; }") # 緑色を濃く
+        self._check.adjustSize()
+
+        # ポップアップ（画像＋メッセージ）
+        self._popup = QWidget(self)
+        vbox = QVBoxLayout()
+        vbox.setContentsMargins(0, 0, 0, 0)
+        vbox.setSpacing(8)
+        self._popup.setLayout(vbox)
+
+        # 背景画像（任意）
+        self._img_label = QLabel(self._popup)
+        self._img_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._img_label.hide()
+        vbox.addWidget(self._img_label, 0, Qt.AlignmentFlag.AlignHCenter)
+
+        # タスクタイトル
+        self._title_label = QLabel(self._popup)
+        self._title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._title_label.setStyleSheet("QLabel { color: #101010; font-size: 24px; font-weight: bold; }")
+        vbox.addWidget(self._title_label, 0, Qt.AlignmentFlag.AlignHCenter)
+
+        # 完了メッセージ
+        done_label = QLabel("完了しました！", self._popup)
+        done_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        done_label.setStyleSheet("QLabel { color: #101010; font-size: 20px; }")
+        vbox.addWidget(done_label, 0, Qt.AlignmentFlag.AlignHCenter)
+
+        # ねぎらいの言葉
+        thanks_label = QLabel("お疲れさま！よく頑張りました。", self._popup)
+        thanks_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        thanks_label.setStyleSheet("QLabel { color: #2a6; font-size: 18px; }")
+        vbox.addWidget(thanks_label, 0, Qt.AlignmentFlag.AlignHCenter)
+
+        # アニメーションも使い回す
+        self._bar_anim = QPropertyAnimation(self._bar, b"pos", self)
+        self._bar_anim.setDuration(300)
+        self._check_anim = self._fade_out(self._check, 500) # 全体として短く (1.0 -> 0.5s)
+        self._flow_anim = self._fade_out(self._flow, 500)
+        self._popup_anim = self._fade_out(self._popup, 2000)
+        self._check_anim.finished.connect(self._on_effects_finished)
+        self._popup_anim.finished.connect(self._on_popup_finished)
+
+        for w in (self._flow, self._check, self._popup):
+            w.hide()
+        self.hide()
+
+    def _fade_out(self, widget: QWidget, duration_ms: int) -> QPropertyAnimation:
+        effect = QGraphicsOpacityEffect(widget)
+        widget.setGraphicsEffect(effect)
+        anim = QPropertyAnimation(effect, b"opacity", self)
+        anim.setDuration(duration_ms)
+        anim.setStartValue(1.0)
+        anim.setEndValue(0.0)
+        return anim
+
+    def _cover_parent(self) -> None:
+        parent = self.parentWidget()
+        if parent is not None and self.geometry() != parent.rect():
+            self.setGeometry(parent.rect())
+        self.show()
+        self.raise_()
+
+    def show_effects(self) -> None:
+        """流れ効果とチェックマークを（再生中なら最初から）表示する。"""
+        self._cover_parent()
+        w = self.width()
+        h = self.height()
+        self._flow.setGeometry(0, 0, w, h)
+        self._bar.setGeometry(-w // 3, 0, w // 3, h)
+        self._check.move((w - self._check.width()) // 2, (h - self._check.height()) // 2)
+        for anim in (self._bar_anim, self._check_anim, self._flow_anim):
+            anim.stop()
+        self._bar_anim.setStartValue(QPoint(-w // 3, 0))
+        self._bar_anim.setEndValue(QPoint(w, 0))
+        self._flow.show()
+        self._check.show()
+        self._bar_anim.start()
+        self._check_anim.start()
+        self._flow_anim.start()
+
+    def show_popup(self, title: str, pixmap: QPixmap, duration_ms: int) -> None:
+        """ポップアップの内容を差し替えて表示し、フェードアウトを最初からやり直す。"""
+        self._cover_parent()
+        if pixmap.isNull():
+            self._img_label.hide()
+        else:
+            if self._img_label.pixmap().cacheKey() != pixmap.cacheKey():
+                self._img_label.setPixmap(pixmap)
+            self._img_label.show()
+        self._title_label.setText(title or "タスク")
+        self._popup.adjustSize()
+
+        # 画面中央へ配置
+        pw = self._popup.width()
+        ph = self._popup.height()
+        self._popup.move(max(0, (self.width() - pw) // 2), max(0, (self.height() - ph) // 2))
+
+        self._popup_anim.stop()
+        self._popup_anim.setDuration(duration_ms)
+        self._popup.show()
+        self._popup_anim.start()
+
+    def _on_effects_finished(self) -> None:
+        self._flow.hide()
+        self._check.hide()
+        self._hide_if_idle()
+
+    def _on_popup_finished(self) -> None:
+        self._popup.hide()
+        self._hide_if_idle()
+
+    def _hide_if_idle(self) -> None:
+        if self._popup.isHidden() and self._check.isHidden():
+            self.hide()
+
+
 class Shibarania(QWidget):
     # Console thread-safe requests into the UI thread
     request_add_task = pyqtSignal(str, str)
     request_delete_task = pyqtSignal(str)
     request_move_task = pyqtSignal(str, str)  # title, destination section
     request_set_tasks = pyqtSignal(list, list)  # current, done
+    request_merge_tasks = pyqtSignal(list, bool)  # 全件取得中に届いた未完了タスクの 1 ページ分, 最初のページか
+    status_write_finished = pyqtSignal(str, str, str)  # task_id, destination, error message ("" on success)
 
     def dragEnterEvent(self, a0):
         if not a0:
@@ -479,14 +938,20 @@ class Shibarania(QWidget):
             # 完了エリア外
             a0.ignore()
 
-    def __init__(self, fullscreen: bool = False):
+    def __init__(self, fullscreen: bool = False, measure_sound_latency: bool = False, perf_overlay: bool = False):
         super().__init__()
         self.setWindowTitle("Shibarania")
         self.setGeometry(100, 100, 800, 480)
 
         self.is_fullscreen = fullscreen
         self.ui_scale = 0.85 if self.is_fullscreen else 1.0
+        # 計測オーバーレイ（--perf）。無効時は None
+        self._perf: PerfMonitor | None = PerfMonitor(self) if perf_overlay else None
+        # assets/ の画像・音声を裏で読み込んでおく（フィードバック時にディスクを読まないように）
+        AssetCache().preload(background=True)
         self._focus_task_id: str | None = None
+        self._menu_btn: QPushButton | None = None
+        self._applied_theme_version: int | None = None
 
         # エッジスワイプ/メニュー用
         self._edge_press_pos: QPoint | None = None
@@ -496,40 +961,32 @@ class Shibarania(QWidget):
         self._edge_hold_timer.setSingleShot(True)
         self._edge_hold_timer.timeout.connect(self._edge_hold_timeout)
 
+        # 履歴パネル（完了済み）に表示する件数。同期時はこの件数だけを保持する
+        self.history_size: int = 2
+
         # ポップアップ表示時間（ミリ秒）
         self.popup_duration_ms: int = 4000
 
-        # 完了時の効果音
-        self._complete_sound: QSoundEffect | None = None
-        self._complete_player: QMediaPlayer | None = None
-        self._complete_audio: QAudioOutput | None = None
-        sound_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "決定ボタンを押す1.mp3")
-        self._setup_complete_sound(sound_path)
-
-        # 持ち上げ時の効果音
-        self._lift_sound: QSoundEffect | None = None
-        self._lift_player: QMediaPlayer | None = None
-        self._lift_audio: QAudioOutput | None = None
-        lift_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "カーソル移動2.mp3")
-        self._setup_lift_sound(lift_path)
+        # 効果音（初回のみ PCM にデコードしてキャッシュし、以降は QSoundEffect で鳴らす）
+        self._sounds = SoundEngine(self, measure_latency=measure_sound_latency)
+        self._setup_complete_sound(asset_path("決定ボタンを押す1.mp3"))
+        self._setup_lift_sound(asset_path("カーソル移動2.mp3"))
 
         # Google Tasklist ID（先頭のリストを利用）
         self.google_tasklist_id: typing.Optional[str] = None
+        # 差分同期用のローカルタスクストア（tasks_cache.json に永続化）
+        self._task_store = backend.TaskDeltaStore(min_completed=self.history_size)
+        self._discovery_checked = False
 
         self._peek_offset = 0
+        self._sync_state = SyncWorker.STATE_IDLE
 
-        self.tasks = {
-            "現在のタスク": [
-                {"title": "TaskB", "description": "何らかの問題により"},
-                {"title": "TaskD", "description": "Google Tasksからの読み込みに"},
-                {"title": "TaskE", "description": "失敗しているようです。"},
-                {"title": "TaskF", "description": "ネットワーク接続や"},
-                {"title": "TaskG", "description": "認可設定を確認してください。"},
-            ],
-            "完了済みのタスク": [
-                {"title": "TaskO", "description": " "},
-            ],
-        }
+        # 表示中のタスク（id/タイトル/セクションの索引付き）。追加・移動・削除はすべてこのストア経由で行う。
+        # スナップショットも同期結果もまだ無い間は空のまま表示し、最初の同期に失敗したら案内を表示する
+        self._store = TaskStore()
+        self._has_tasks = False
+        # 全件取得のページ取り込みで、「現在のタスク」の先頭から何件がサーバー順に並んでいるか
+        self._streamed_count = 0
 
         # レイアウト作成
         layout = QHBoxLayout()
@@ -538,7 +995,7 @@ class Shibarania(QWidget):
             layout.setSpacing(8)
 
         # セクション作成
-        current_section = self._create_section("現在のタスク", self.tasks["現在のタスク"])
+        current_section = self._create_section("現在のタスク", self._store.section("現在のタスク"))
         current_section.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         layout.addWidget(current_section, 2)
 
@@ -548,7 +1005,8 @@ class Shibarania(QWidget):
         self._history_panel = SectionWidget("完了済みのタスク")
         self._history_panel.setParent(self)
         self._history_panel.entered = False # type: ignore
-        # テーマ依存スタイルは _apply_theme で設定
+        # テーマ依存スタイルは _apply_theme で設定（QSS の QFrame#HistoryPanel）
+        self._history_panel.setObjectName("HistoryPanel")
         self._history_panel.dropped.connect(self.on_task_dropped)
         self._history_panel_layout = QVBoxLayout()
         # パネル自体は背景透明にして、中身のContainerに背景を持たせるためmargin 0
@@ -577,6 +1035,22 @@ class Shibarania(QWidget):
         self._drag_arrow_overlay.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         self._drag_arrow_overlay.hide()
 
+        # 非モーダル通知（API 反映失敗時など）
+        self._notice_label = QLabel(self)
+        self._notice_label.setWordWrap(True)
+        self._notice_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._notice_label.setStyleSheet(
+            "QLabel { background-color: rgba(40,40,40,220); color: white; font-size: 16px; padding: 12px 20px; border-radius: 10px; }"
+        )
+        self._notice_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self._notice_label.hide()
+        self._notice_timer = QTimer(self)
+        self._notice_timer.setSingleShot(True)
+        self._notice_timer.timeout.connect(self._notice_label.hide)
+
+        # 完了ポップアップ/効果の常設オーバーレイ（完了のたびにウィジェットを作らない）
+        self._completion_overlay = CompletionOverlay(self)
+
         # ドラッグ&ドロップの受け入れ（完了エリアの検出用）
         self.setAcceptDrops(True)
         
@@ -590,17 +1064,31 @@ class Shibarania(QWidget):
         self.request_delete_task.connect(self.delete_task)
         self.request_move_task.connect(self.move_task)
         self.request_set_tasks.connect(self._apply_google_sections)
+        self.request_merge_tasks.connect(self._merge_google_page)
+        self.status_write_finished.connect(self._on_status_write_finished)
+
+        # 完了/未完了の変更はジャーナル（outbox.jsonl）へ記録してからバックグラウンドで送信する
+        self._outbox = outbox.StatusOutbox()
+        self._outbox_sender = outbox.OutboxSender(
+            self._outbox,
+            self._send_status_changes,
+            lambda task_id, status, error: self.status_write_finished.emit(
+                task_id, "完了済みのタスク" if status == backend.STATUS_COMPLETED else "現在のタスク", error
+            ),
+        )
+        self._outbox_sender.start()
 
-        # Google Tasks から初期タスクを読み込み
+        # 前回同期時のスナップショットを即時描画（ネットワーク同期はこの後バックグラウンドで行う）
+        self._last_snapshot: bytes | None = None
         try:
-            self._load_tasks_from_google()
+            self._load_tasks_from_snapshot()
         except Exception:
-            # 認可未設定やネットワーク障害時などは初期データのまま表示
+            # スナップショットが無い/壊れている場合は空のまま最初の同期を待つ
             pass
 
-        # 定期同期タイマー開始（60秒間隔）
+        # 定期同期開始（60秒間隔から開始し、操作/変更状況に応じて 15 秒〜10 分で調整）
         try:
-            self._start_periodic_sync(60_000)
+            self._start_periodic_sync(60_000, min_interval_ms=15_000, max_interval_ms=600_000)
         except Exception:
             pass
 
@@ -614,9 +1102,7 @@ class Shibarania(QWidget):
         if not t:
             return False
         d = description if description is not None else ""
-        if "現在のタスク" not in self.tasks or not isinstance(self.tasks["現在のタスク"], list):
-            self.tasks["現在のタスク"] = []
-        self.tasks["現在のタスク"].append({"title": t, "description": d})
+        self._store.add(TaskRecord(t, d), "現在のタスク")
         try:
             self.refresh_ui()
         except Exception:
@@ -627,20 +1113,14 @@ class Shibarania(QWidget):
         """タイトルで最初に一致するタスクをどちらかのセクションから削除し UI を更新する。"""
         if not title:
             return False
-        for section in ["現在のタスク", "完了済みのタスク"]:
-            tasks_list = self.tasks.get(section, [])
-            for idx, task in enumerate(list(tasks_list)):
-                if task.get("title") == title:
-                    try:
-                        del tasks_list[idx]
-                    except Exception:
-                        return False
-                    try:
-                        self.refresh_ui()
-                    except Exception:
-                        pass
-                    return True
-        return False
+        task = self._store.find_by_title(title)
+        if task is None or not self._store.remove(task):
+            return False
+        try:
+            self.refresh_ui()
+        except Exception:
+            pass
+        return True
 
     def move_task(self, title: str, destination: str) -> bool:
         """タイトルでタスクを探し destination("現在のタスク" or "完了済みのタスク") へ移動する。"""
@@ -648,43 +1128,37 @@ class Shibarania(QWidget):
             return False
         if not title:
             return False
-        # Ensure destination list exists
-        if destination not in self.tasks or not isinstance(self.tasks[destination], list):
-            self.tasks[destination] = []
-        # Search both sections
-        for section in ["現在のタスク", "完了済みのタスク"]:
-            tasks_list = self.tasks.get(section, [])
-            for idx, task in enumerate(list(tasks_list)):
-                if task.get("title") == title:
-                    # If already in destination just return True (no duplicate move)
-                    if section == destination:
-                        return True
-                    # Move
-                    try:
-                        moved = tasks_list.pop(idx)
-                    except Exception:
-                        return False
-                    self.tasks[destination].append(moved)
-                    try:
-                        self.refresh_ui()
-                    except Exception:
-                        pass
-                    return True
-        return False
+        task = self._store.find_by_title(title)
+        if task is None:
+            return False
+        # If already in destination just return True (no duplicate move)
+        if task.section == destination:
+            return True
+        if not self._store.move(task, destination):
+            return False
+        try:
+            self.refresh_ui()
+        except Exception:
+            pass
+        return True
 
     def _apply_theme(self) -> None:
+        """テーマのスタイルシートをウィンドウに適用する。
+
+        テーマのバージョンが変わっていなければ何もしない（新しいウィジェットは
+        ウィンドウのスタイルシートをそのまま継承する）。
+        """
         mgr = ThemeManager()
+        if self._applied_theme_version == mgr.version:
+            return
+        self._applied_theme_version = mgr.version
+        # setStyleSheet で子孫ウィジェットは Qt により再ポリッシュされる
         self.setStyleSheet(mgr.get_style_sheet())
-        
-        # 完了パネルにも新しいスタイルを適用するためにID更新などをトリガー
-        self._history_panel.setObjectName("HistoryPanel")
-        self._history_panel.style().unpolish(self._history_panel)
-        self._history_panel.style().polish(self._history_panel)
-        
-        # 既存子要素にも適用
-        for w in self.findChildren(QLabel):
-            w.style().unpolish(w)
-            w.style().polish(w)
+        self._style_menu_button()
+        # カード個別のスタイル（フォーカス枠/影）はテーマ色を含むので付け直す
+        board = getattr(self, "_task_board", None)
+        if board is not None:
+            board.apply_theme()
 
     def _create_section(self, title, tasks):
         section_widget = SectionWidget(title)
@@ -716,15 +1190,9 @@ class Shibarania(QWidget):
             menu_btn = QPushButton("≡", section_widget)
             menu_btn.setFlat(True)
             menu_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+            self._menu_btn = menu_btn
             # テーマに応じた色設定
-            is_dark = ThemeManager().is_dark
-            base_color = "rgba(255,255,255,0.7)" if is_dark else "rgba(0,0,0,0.3)"
-            hover_color = "rgba(255,255,255,1.0)" if is_dark else "rgba(0,0,0,0.8)"
-            
-            menu_btn.setStyleSheet(f"""
-                QPushButton {{ color: {base_color}; font-size: 32px; border: none; background: transparent; }}
-                QPushButton:hover {{ color: {hover_color}; }}
-            """)
+            self._style_menu_button()
             menu_btn.clicked.connect(self._show_menu_panel)
             menu_btn.setFixedSize(48, 48)
             header_layout.addWidget(menu_btn)
@@ -735,63 +1203,37 @@ class Shibarania(QWidget):
         section_layout.addLayout(header_layout)
 
         if title == "現在のタスク":
-            scroll_area = QWidget() # グリッドを配置するためのコンテナ
-            current_grid = QGridLayout()
-            current_grid.setSpacing(16)
-            current_grid.setContentsMargins(0, 0, 0, 0)
-            
-            row = 0
-            col = 0
-            for idx, task in enumerate(tasks):
-                task_frame = TaskWidget(task, title)
-                # フォーカスタスクの強調（先頭を採用）
-                if idx == 0:
-                    task_frame.set_focus_enabled(True)
-                    self._focus_task_id = task.get("id") or task.get("title")
-
-                task_layout = QVBoxLayout()
-                task_layout.setContentsMargins(16, 16, 16, 16)
-                
-                # タイトル
-                task_title_label = QLabel(task["title"])
-                task_title_label.setObjectName("TaskTitle")
-                task_title_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
-                task_title_label.setWordWrap(True)
-                task_layout.addWidget(task_title_label)
-
-                # 説明
-                if task.get("description"):
-                    task_content_label = QLabel(task["description"])
-                    task_content_label.setObjectName("TaskDesc")
-                    task_content_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
-                    task_content_label.setWordWrap(True)
-                    task_layout.addWidget(task_content_label)
-                
-                # スペーサーで上詰め
-                task_layout.addStretch()
-
-                task_frame.setLayout(task_layout)
-                
-                # フォーカスタスクは横幅いっぱい、それ以外はグリッド
-                if idx == 0:
-                    current_grid.addWidget(task_frame, 0, 0, 1, 2) # colspan 2
-                    row = 1
-                    col = 0
-                else:
-                    current_grid.addWidget(task_frame, row, col)
-                    col += 1
-                    if col >= 2:
-                        col = 0
-                        row += 1
-            section_layout.addLayout(current_grid)
-            section_layout.addStretch() # 下余白
+            # 表示範囲のカードだけを生成する仮想化ボード（スクロール可能）
+            self._task_model = TaskListModel(self)
+            self._task_board = VirtualTaskBoard(self._task_model, title, self.ui_scale, section_widget)
+            section_layout.addWidget(self._task_board, 1)
         else:
             # 他のセクション（基本的に使われないか、完了済みリストなど）
             pass
 
         section_widget.setLayout(section_layout)
+        if title == "現在のタスク":
+            self._reconcile_current_tasks(tasks)
         return section_widget
 
+    def _style_menu_button(self) -> None:
+        menu_btn = getattr(self, "_menu_btn", None)
+        if menu_btn is None:
+            return
+        is_dark = ThemeManager().is_dark
+        base_color = "rgba(255,255,255,0.7)" if is_dark else "rgba(0,0,0,0.3)"
+        hover_color = "rgba(255,255,255,1.0)" if is_dark else "rgba(0,0,0,0.8)"
+        
+        menu_btn.setStyleSheet(f"""
+            QPushButton {{ color: {base_color}; font-size: 32px; border: none; background: transparent; }}
+            QPushButton:hover {{ color: {hover_color}; }}
+        """)
+
+    def _reconcile_current_tasks(self, tasks: list) -> None:
+        """「現在のタスク」をボードのモデルへ反映する。カードの割り当てはボード側で表示範囲だけ行う。"""
+        self._focus_task_id = (tasks[0].get("id") or tasks[0].get("title")) if tasks else None
+        self._task_model.set_tasks(tasks)
+
     def peek_history_panel(self, offset: int) -> None:
         """ドラッグ中に履歴パネルをチラ見せする"""
         if offset == self._peek_offset:
@@ -822,156 +1264,69 @@ class Shibarania(QWidget):
         palette.setColor(QPalette.ColorRole.Window, color)
         return palette
 
-    def _clear_layout(self, layout):
-        if layout is None:
-            return
-        while layout.count():
-            item = layout.takeAt(0)
-            if item is None:
-                continue
-            widget = item.widget()
-            child_layout = item.layout()
-            if widget is not None:
-                widget.setParent(None)
-                widget.deleteLater()
-            elif child_layout is not None:
-                self._clear_layout(child_layout)
-
     def refresh_ui(self):
-        main_layout = self.layout()
-        if main_layout is None:
-            main_layout = QHBoxLayout()
-            self.setLayout(main_layout)
-        else:
-            self._clear_layout(main_layout)
-
-        current_section = self._create_section("現在のタスク", self.tasks.get("現在のタスク", []))
-        current_section.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        main_layout.addWidget(current_section)
-
-        self._apply_theme()
-        self.update()
-        self._update_history_panel()
-
-    def _load_tasks_from_google(self) -> None:
-        """Google Tasks からタスクを取得して UI に反映する。"""
-        creds = backend.get_credentials()
-        service = backend.build_tasks_service(creds)
-        tasklists = backend.list_tasklists(service)
-        if not tasklists:
+        with perf_span(self._perf, "refresh_ui"):
+            # カードは作り直さず、モデル経由で表示範囲のカードだけを差分更新する
+            self._reconcile_current_tasks(self._store.section("現在のタスク"))
+
+            self._apply_theme()
+            self.update()
+            self._update_history_panel()
+
+    def _load_tasks_from_snapshot(self) -> None:
+        """ディスク上のスナップショットからタスクを読み込み UI に反映する（通信なし）。"""
+        loaded = snapshot.load_snapshot()
+        if loaded is None:
             return
-        first_list_id = tasklists[0]["id"]
-        self.google_tasklist_id = first_list_id
-        tasks = backend.list_tasks(service, first_list_id, show_completed=True, show_hidden=True)
-        current, done = self._convert_google_tasks_to_sections(tasks)
-        self.tasks["現在のタスク"] = current
-        self.tasks["完了済みのタスク"] = done
+        list_id, current, done = loaded
+        if list_id:
+            self.google_tasklist_id = list_id
+        current, done = self._overlay_pending_writes(current, done)
+        self._store.replace_section("現在のタスク", current)
+        self._store.replace_section("完了済みのタスク", done)
+        self._has_tasks = True
         try:
             self.refresh_ui()
         except Exception:
             pass
 
-    def _convert_google_tasks_to_sections(self, google_tasks: list[dict]) -> tuple[list[dict], list[dict]]:
-        current: list[dict] = []
-        done_all: list[dict] = []
-        for t in google_tasks:
-            title = t.get("title") or "(無題)"
-            desc = t.get("notes") or ""
-            entry = {"title": title, "description": desc, "id": t.get("id"), "completed": t.get("completed")}
-            if t.get("status") == "completed":
-                done_all.append(entry)
-            else:
-                current.append(entry)
-        # 完了済みは完了日時で降順に並べ、最新2件のみ採用
-        def _dt(s: typing.Optional[str]) -> datetime:
-            if not s:
-                return datetime.min
-            try:
-                # RFC3339 'Z' を Python 互換に変換
-                return datetime.fromisoformat(s.replace("Z", "+00:00"))
-            except Exception:
-                return datetime.min
-        done_sorted = sorted(done_all, key=lambda e: _dt(e.get("completed")), reverse=True)
-        done_top2 = done_sorted[:2]
-        return current, done_top2
+    def _convert_google_tasks_to_sections(self, google_tasks: typing.Iterable[dict]) -> tuple[list[dict], list[dict]]:
+        """Google Tasks のタスク（ページ単位で受け取るなら feed を繰り返す）をセクションに振り分ける。
+
+        完了済みは完了日時が新しい history_size 件だけをサイズ上限付きのヒープで保持する。
+        """
+        acc = SectionAccumulator(self.history_size)
+        acc.feed(google_tasks)
+        return acc.result()
 
     def on_task_dropped(self, payload: dict, destination: str, global_pos: QPoint | None = None) -> None:
         """ドラッグ&ドロップで別セクションへ移動したときにAPI/UI反映。"""
+        with perf_span(self._perf, "drop"):
+            self._handle_task_drop(payload, destination)
+
+    def _handle_task_drop(self, payload: dict, destination: str) -> None:
         # 現在のUIから該当タスクを見つける（id 優先）
-        task = None
-        for sec in ["現在のタスク", "完了済みのタスク"]:
-            for t in self.tasks.get(sec, []):
-                if payload.get("id") and t.get("id") == payload.get("id"):
-                    task = t
-                    break
-                if not payload.get("id") and t.get("title") == payload.get("title"):
-                    task = t
-                    break
-            if task:
-                break
-        if not task:
+        task = self._store.find(payload.get("id"), payload.get("title"))
+        if task is None:
             return
-        source = "完了済みのタスク" if self._is_task_in_section(task, "完了済みのタスク") else "現在のタスク"
+        source = task.section
         if source == destination:
             return
 
         # 完了などの条件判定
         # すでに dropEvent 側で「画面右側なら完了」と判断して destination="完了済みのタスク" で渡してきているため
         # ここでは座標判定などを厳密に行う必要はない。
-        # ただし、完了パネルが全く見えていない状態での誤操作防止等の意図があるなら別だが、
-        # 今回は「完了しやすくする」方向で修正するため、条件を緩和する。
 
+        # 楽観的更新：先にローカル状態と UI を更新し、API 反映はバックグラウンドで行う。
+        # 失敗した場合は _on_status_write_finished でロールバックする。
         try:
-            if not (self.google_tasklist_id and task.get("id")):
-                # ローカルのみの場合はAPI呼び出ししないが、一応IDチェック
-                # IDがない場合はAPI連携できないので無視するか、ローカル移動のみ行う
-                pass 
-            
-            # API連携部分
-            if self.google_tasklist_id and task.get("id"):
-                creds = backend.get_credentials()
-                service = backend.build_tasks_service(creds)
-                if destination == "完了済みのタスク":
-                    backend.complete_task(service, self.google_tasklist_id, task["id"])
-                else:
-                    backend.uncomplete_task(service, self.google_tasklist_id, task["id"])
-        except HttpError as e:
-            try:
-                resp = getattr(e, "resp", None)
-                status = getattr(e, "status_code", None) or (resp.status if resp is not None else None)
-            except Exception:
-                status = None
-            if status == 403:
-                try:
-                    backend.force_reauthorize()
-                    creds = backend.get_credentials()
-                    service = backend.build_tasks_service(creds)
-                    if not self.google_tasklist_id:
-                        raise RuntimeError("tasklist_id が不明です")
-                    if destination == "完了済みのタスク":
-                        backend.complete_task(service, self.google_tasklist_id, task["id"])
-                    else:
-                        backend.uncomplete_task(service, self.google_tasklist_id, task["id"])
-                except Exception as e2:
-                    self.raise_error(f"Google Tasksへの反映に失敗しました。認可設定を確認してください。\n{str(e2)}")
-                    return
-            else:
-                self.raise_error(f"Google Tasksへの反映に失敗しました。認可設定を確認してください。\n{str(e)}")
-                return
-        except Exception as e:
-            # APIエラーでもローカル移動は試みるか、エラー表示して止めるか。
-            # 今回はエラー表示のみして return (同期ズレを防ぐため)
-            # ただし ID がない(ローカルダミー)の場合は例外が出るので無視して進む
-            if "tasklist_id" in str(e) or "task id" in str(e):
-                pass
-            else:
-                self.raise_error(str(e))
-                return
-
-        try:
-            self._move_task_dict(task, destination)
+            self._move_task_record(task, destination)
         except Exception:
             pass
+        # 送信待ちへの記録は画面の更新後（ジャーナルの書き込み自体も別スレッド）
+        self._note_user_activity()
+        if self.google_tasklist_id and task.get("id"):
+            self._enqueue_status_write(self.google_tasklist_id, task["id"], source, destination)
         # 完了時のポップアップ表示
         if destination == "完了済みのタスク":
             try:
@@ -982,75 +1337,240 @@ class Shibarania(QWidget):
             except Exception:
                 pass
 
-    def _move_task_dict(self, task: dict, destination: str) -> None:
+    def _move_task_record(self, task: TaskRecord, destination: str) -> None:
         if destination not in ("現在のタスク", "完了済みのタスク"):
             return
-        # もとの場所から削除
-        for section in ["現在のタスク", "完了済みのタスク"]:
-            lst = self.tasks.get(section, [])
-            for i, t in enumerate(list(lst)):
-                if t is task or (task.get("id") and t.get("id") == task.get("id")):
-                    lst.pop(i)
-                    break
-        # 追加
-        if destination not in self.tasks or not isinstance(self.tasks[destination], list):
-            self.tasks[destination] = []
-        self.tasks[destination].append(task)
+        # 完了済みは新しい順に並べるので、完了したばかりのタスクは先頭に置く（履歴パネルに表示される）
+        self._store.move(task, destination, front=destination == "完了済みのタスク")
         self.refresh_ui()
 
-    def _is_task_in_section(self, task: dict, section: str) -> bool:
-        lst = self.tasks.get(section, [])
-        for t in lst:
-            if t is task:
-                return True
-            if task.get("id") and t.get("id") == task.get("id"):
-                return True
-        return False
+    def _enqueue_status_write(self, tasklist_id: str, task_id: str, source: str, destination: str) -> None:
+        """完了/未完了の変更を送信待ちキューへ記録する（UIスレッドでは通信しない）。"""
+        def _status(section: str) -> str:
+            return backend.STATUS_COMPLETED if section == "完了済みのタスク" else backend.STATUS_NEEDS_ACTION
+
+        self._outbox.record(tasklist_id, task_id, _status(destination), _status(source))
+
+    def _send_status_changes(self, tasklist_id: str, changes: list) -> list:
+        """送信スレッドから呼ばれる。403 は再認可して 1 度だけ再送する。"""
+        results = backend.apply_status_changes(tasklist_id, changes, max_retries=0)
+        forbidden = [i for i, r in enumerate(results) if backend.http_error_status(r["error"]) == 403]
+        if forbidden:
+            backend.force_reauthorize()
+            retried = backend.apply_status_changes(tasklist_id, [changes[i] for i in forbidden], max_retries=0)
+            for i, r in zip(forbidden, retried):
+                results[i] = r
+        return results
+
+    def _on_status_write_finished(self, task_id: str, destination: str, error: str) -> None:
+        """書き込みワーカーの完了通知（UIスレッド）。失敗時はロールバックして通知する。"""
+        if not error:
+            return
+        # 後続の操作が控えている場合はそちらが最終状態になるのでロールバックしない
+        rolled_back = False
+        if self._outbox.pending_status(task_id) is None:
+            task = self._store.find_by_id(task_id)
+            if task is not None and task.section == destination:
+                source = "現在のタスク" if destination == "完了済みのタスク" else "完了済みのタスク"
+                try:
+                    self._move_task_record(task, source)
+                    rolled_back = True
+                except Exception:
+                    pass
+        if rolled_back:
+            self._show_notice(f"Google Tasksへの反映に失敗したため元に戻しました。\n{error}")
+        else:
+            self._show_notice(f"Google Tasksへの反映に失敗しました。\n{error}")
+
+    def _overlay_pending_writes(self, current: list, done: list) -> tuple[list, list]:
+        """未反映の書き込みがあるタスクは、同期結果よりローカルの移動先を優先する。"""
+        pending = self._outbox.pending_targets()
+        if not pending:
+            return current, done
+        targets = {
+            task_id: "完了済みのタスク" if status == backend.STATUS_COMPLETED else "現在のタスク"
+            for task_id, status in pending.items()
+        }
+        new_current: list = []
+        new_done: list = []
+        for section, tasks in (("現在のタスク", current), ("完了済みのタスク", done)):
+            for t in tasks:
+                dest = targets.get(t.get("id"), section)
+                (new_done if dest == "完了済みのタスク" else new_current).append(t)
+        return new_current, new_done
 
     def _apply_google_sections(self, current: list, done: list) -> None:
         """スレッドから受け取ったタスクリストをUI状態へ反映。"""
-        self.tasks["現在のタスク"] = list(current)
-        self.tasks["完了済みのタスク"] = list(done)
+        current, done = self._overlay_pending_writes(current, done)
+        self._has_tasks = True
+        new_tasks = {"現在のタスク": list(current), "完了済みのタスク": list(done)}
+        changes = diff_sections(self._store.as_sections(), new_tasks)
+        if changes.is_empty():
+            # 変化なし：UI には一切触れない
+            return
+        self._store.replace_section("現在のタスク", new_tasks["現在のタスク"])
+        self._store.replace_section("完了済みのタスク", new_tasks["完了済みのタスク"])
         try:
-            self.refresh_ui()
+            with perf_span(self._perf, "sync_apply"):
+                self._apply_section_changes(changes)
         except Exception:
             pass
 
-    def _start_periodic_sync(self, interval_ms: int) -> None:
-        self._sync_timer = QTimer(self)
-        self._sync_timer.setInterval(interval_ms)
-        self._sync_timer.timeout.connect(self._sync_google_in_background)
-        self._sync_timer.start()
-
-        # 初回も少し遅延して開始
-        QTimer.singleShot(2_000, self._sync_google_in_background)
+    def _merge_google_page(self, current: list, first: bool) -> None:
+        """全件取得の途中で届いた未完了タスクのページを UI 状態へ取り込む。
+
+        ページはサーバーの並び順（position 順）で届くので、取り込み済みのページの直後に並べる。
+        最初のページでは id の無いタスク（読み込み失敗時の案内など）を取り除き、
+        先頭のカード（フォーカス）が 1 回の往復で実際のタスクになるようにする。
+        ページ外のタスクの削除や最終的な並び順は、最後の _apply_google_sections に任せる。
+        """
+        current, _done = self._overlay_pending_writes(current, [])
+        if first:
+            self._streamed_count = 0
+        existing = self._store.section("現在のタスク")
+        streamed = existing[: self._streamed_count]
+        changed = False
+        page: list[TaskRecord] = []
+        for entry in current:
+            record = self._store.find_by_id(entry.get("id"))
+            if record is None:
+                record = TaskRecord.from_dict(entry, "現在のタスク")
+            elif self._store.update(record, entry):
+                changed = True
+            page.append(record)
+        in_page = set(page)
+        rest = [r for r in existing[self._streamed_count:] if r not in in_page and (r.id or not first)]
+        ordered = streamed + page + rest
+        self._streamed_count += len(page)
+        self._has_tasks = True
+        if not changed and ordered == existing:
+            return
+        # 完了済み側にあったタスク（リモートで未完了に戻されたもの）は add() が移動させる
+        self._store.replace_section("現在のタスク", ordered)
+        try:
+            with perf_span(self._perf, "sync_page"):
+                self.refresh_ui()
+        except Exception:
+            pass
 
-    def _sync_google_in_background(self) -> None:
+    def _apply_section_changes(self, changes: SectionChanges) -> None:
+        """変更のあったセクションだけを UI に反映する。"""
+        touched = changes.touched_sections()
+        if "現在のタスク" in touched:
+            self.refresh_ui()
+        elif "完了済みのタスク" in touched:
+            self._update_history_panel()
+
+    def _start_periodic_sync(self, interval_ms: int, min_interval_ms: int = 15_000, max_interval_ms: int = 600_000) -> None:
+        # 1 本のワーカーで周期同期/要求同期をまとめて扱う（同時に複数のフェッチは走らない）
+        self._sync_worker = SyncWorker(
+            self._fetch_google_tasks_and_emit,
+            interval_ms=interval_ms,
+            min_interval_ms=min_interval_ms,
+            max_interval_ms=max_interval_ms,
+            parent=self,
+        )
+        self._sync_worker.state_changed.connect(self._on_sync_state_changed)
+        # 起動直後にバックグラウンドで最新化（画面はスナップショットで描画済み）
+        self._sync_worker.start(initial_delay_ms=0)
+
+    def _sync_google_in_background(self, force: bool = False) -> None:
+        worker = getattr(self, "_sync_worker", None)
+        if worker is not None:
+            worker.request_sync(force=force)
+
+    def _note_user_activity(self) -> None:
+        """ローカル操作があったことを同期ワーカーへ伝える（同期間隔を短くする）。"""
+        worker = getattr(self, "_sync_worker", None)
+        if worker is not None:
+            worker.note_activity()
+
+    def _on_sync_state_changed(self, state: str) -> None:
+        self._sync_state = state
+        if state == SyncWorker.STATE_BACKOFF and not self._has_tasks:
+            self._show_load_failure()
+
+    def _show_load_failure(self) -> None:
+        """一度もタスクを表示できないまま同期に失敗したときの案内（ダミーのタスク）を表示する。"""
+        self._store.replace_section("現在のタスク", [
+            {"title": "TaskB", "description": "何らかの問題により"},
+            {"title": "TaskD", "description": "Google Tasksからの読み込みに"},
+            {"title": "TaskE", "description": "失敗しているようです。"},
+            {"title": "TaskF", "description": "ネットワーク接続や"},
+            {"title": "TaskG", "description": "認可設定を確認してください。"},
+        ])
+        self._store.replace_section("完了済みのタスク", [
+            {"title": "TaskO", "description": " "},
+        ])
         try:
-            threading.Thread(target=self._fetch_google_tasks_and_emit, daemon=True).start()
+            self.refresh_ui()
         except Exception:
             pass
 
-    def _fetch_google_tasks_and_emit(self) -> None:
+    def _fetch_google_tasks_and_emit(self) -> bool:
+        """同期ワーカーのスレッド上で呼ばれる。内容が変わっていれば True を返す。
+
+        失敗時は例外を送出し、ワーカーがバックオフする。
+        """
+        service = backend.get_service()
+        list_id = self.google_tasklist_id
+        if not list_id:
+            tls = backend.list_tasklists(service)
+            if not tls:
+                return False
+            list_id = tls[0]["id"]
+            # 参照だけの更新なので問題なし
+            self.google_tasklist_id = list_id
+        # 全件取得になった場合は、未完了タスクのページが届くたびに UI へ取り込む
+        acc = SectionAccumulator(0)
+        first_page = True
+
+        def on_page(page: list) -> None:
+            nonlocal first_page
+            entries = acc.feed(page)
+            if entries:
+                self.request_merge_tasks.emit(entries, first_page)
+                first_page = False
+
+        tasks = self._task_store.sync(service, list_id, on_page=on_page)
+        current, done = self._convert_google_tasks_to_sections(tasks)
+        # 次回起動時の即時描画用に保存（内容が変わったときだけ書き込む）
+        data = snapshot.encode_snapshot(list_id, current, done)
+        changed = data != self._last_snapshot
+        if changed:
+            snapshot.save_snapshot(data)
+            self._last_snapshot = data
+        # UIスレッドへ反映依頼
+        self.request_set_tasks.emit(current, done)
+        if not self._discovery_checked:
+            # 通信できることが分かったので、ディスカバリドキュメントの更新確認を一度だけ裏で行う
+            self._discovery_checked = True
+            threading.Thread(target=self._update_discovery_cache, daemon=True).start()
+        return changed
+
+    @staticmethod
+    def _update_discovery_cache() -> None:
+        """同梱版より新しいディスカバリドキュメントがあれば tasks_discovery.json に保存する（次回起動から使う）。"""
         try:
-            creds = backend.get_credentials()
-            service = backend.build_tasks_service(creds)
-            list_id = self.google_tasklist_id
-            if not list_id:
-                tls = backend.list_tasklists(service)
-                if not tls:
-                    return
-                list_id = tls[0]["id"]
-                # 参照だけの更新なので問題なし
-                self.google_tasklist_id = list_id
-            tasks = backend.list_tasks(service, list_id, show_completed=True, show_hidden=True)
-            current, done = self._convert_google_tasks_to_sections(tasks)
-            # UIスレッドへ反映依頼
-            self.request_set_tasks.emit(current, done)
+            backend.update_discovery_cache()
         except Exception:
-            # ネットワークなどの一時的失敗は無視
             pass
 
+    def _show_notice(self, message: str, duration_ms: int = 5000) -> None:
+        """画面下部に非モーダルの通知を一定時間表示する。"""
+        self._notice_label.setText(message)
+        self._notice_label.adjustSize()
+        max_w = max(200, self.width() - 80)
+        if self._notice_label.width() > max_w:
+            self._notice_label.setFixedWidth(max_w)
+            self._notice_label.adjustSize()
+        x = max(0, (self.width() - self._notice_label.width()) // 2)
+        y = max(0, self.height() - self._notice_label.height() - 32)
+        self._notice_label.move(x, y)
+        self._notice_label.show()
+        self._notice_label.raise_()
+        self._notice_timer.start(duration_ms)
+
     def raise_error(self, message: str) -> None:
         msg = QMessageBox(self)
         msg.setIcon(QMessageBox.Icon.Critical)
@@ -1066,191 +1586,24 @@ class Shibarania(QWidget):
 
     def _show_completion_effects(self) -> None:
         """完了時の流れ効果とチェック表示（簡易版）。 #1 改善"""
-        # 背景に半透明白を敷く（他のタスクを少し透けさせつつ、達成感を演出）
-        flow = QWidget(self)
-        flow.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        flow.setStyleSheet("QWidget { background-color: rgba(255,255,255,40); }") # 半透明白
-        flow.setGeometry(0, 0, self.width(), self.height())
-        flow.show()
-
-        # フローライン（少し控えめに）
-        bar = QWidget(flow)
-        bar.setStyleSheet("QWidget { background-color: rgba(100,255,100,80); }") # 緑っぽく変更
-        bar.setGeometry(-self.width() // 3, 0, self.width() // 3, self.height())
-        bar.show()
-
-        anim = QPropertyAnimation(bar, b"pos", self)
-        anim.setDuration(300)
-        anim.setStartValue(QPoint(-self.width() // 3, 0))
-        anim.setEndValue(QPoint(self.width(), 0))
-        bar._anim = anim  # type: ignore[attr-defined]
-
-        # チェックマーク（縦幅40-50%程度に縮小、フェードアウトを早く）
-        check = QLabel("✓", self)
-        check.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        check.setStyleSheet("QLabel { color: #2E7D32; font-size: 64px; font-weight: bold; }") # 緑色を濃く
-        check.adjustSize()
-        check.move((self.width() - check.width()) // 2, (self.height() - check.height()) // 2)
-        check.show()
-
-        # チェックマークのアニメーション
-        check_effect = QGraphicsOpacityEffect(check)
-        check.setGraphicsEffect(check_effect)
-        check_anim = QPropertyAnimation(check_effect, b"opacity", self)
-        check_anim.setDuration(500) # 全体として短く (1.0 -> 0.5s)
-        check_anim.setStartValue(1.0)
-        check_anim.setEndValue(0.0)
-        check._anim = check_anim  # type: ignore[attr-defined]
-
-        # 背景フェードアウト
-        bg_effect = QGraphicsOpacityEffect(flow)
-        flow.setGraphicsEffect(bg_effect)
-        bg_anim = QPropertyAnimation(bg_effect, b"opacity", self)
-        bg_anim.setDuration(500)
-        bg_anim.setStartValue(1.0)
-        bg_anim.setEndValue(0.0)
-        flow._bg_anim = bg_anim # type: ignore
-
-        def _cleanup():
-            try:
-                check.deleteLater()
-                flow.deleteLater()
-            except Exception:
-                pass
-
-        check_anim.finished.connect(_cleanup)
-        anim.start()
-        check_anim.start()
-        bg_anim.start()
+        self._completion_overlay.show_effects()
 
     def _show_completion_popup(self, title: str = "", duration_ms: int | None = None) -> None:
         """完了時に画像＋メッセージを中央に表示してフェードアウト。"""
-        # 画像パス解決（スクリプト相対）
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        img_path = os.path.join(base_dir, "assets", "rect1.png")
-
-        # オーバーレイ用コンテナ
-        popup = QWidget(self)
-        popup.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        popup.setStyleSheet("QWidget { background: transparent; }")
-
-        vbox = QVBoxLayout()
-        vbox.setContentsMargins(0, 0, 0, 0)
-        vbox.setSpacing(8)
-        popup.setLayout(vbox)
-
-        # 背景画像（任意）
-        img_label = QLabel(popup)
-        pix = QPixmap(img_path)
-        if not pix.isNull():
-            img_label.setPixmap(pix)
-            img_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            vbox.addWidget(img_label, 0, Qt.AlignmentFlag.AlignHCenter)
-
-        # タスクタイトル
-        title_label = QLabel(popup)
-        title_label.setText(title or "タスク")
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("QLabel { color: #101010; font-size: 24px; font-weight: bold; }")
-        vbox.addWidget(title_label, 0, Qt.AlignmentFlag.AlignHCenter)
-
-        # 完了メッセージ
-        done_label = QLabel(popup)
-        done_label.setText("完了しました！")
-        done_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        done_label.setStyleSheet("QLabel { color: #101010; font-size: 20px; }")
-        vbox.addWidget(done_label, 0, Qt.AlignmentFlag.AlignHCenter)
-
-        # ねぎらいの言葉
-        thanks_label = QLabel(popup)
-        thanks_label.setText("お疲れさま！よく頑張りました。")
-        thanks_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        thanks_label.setStyleSheet("QLabel { color: #2a6; font-size: 18px; }")
-        vbox.addWidget(thanks_label, 0, Qt.AlignmentFlag.AlignHCenter)
-
-        popup.adjustSize()
-
-        # 画面中央へ配置
-        w = self.width()
-        h = self.height()
-        pw = popup.width()
-        ph = popup.height()
-        popup.move(max(0, (w - pw) // 2), max(0, (h - ph) // 2))
-        popup.show()
-
-        # フェードアウトアニメーション
-        effect = QGraphicsOpacityEffect(popup)
-        popup.setGraphicsEffect(effect)
-        anim = QPropertyAnimation(effect, b"opacity", self)
-        anim.setDuration(duration_ms if duration_ms is not None else 2000)
-        anim.setStartValue(1.0)
-        anim.setEndValue(0.0)
-        popup._anim = anim  # type: ignore[attr-defined]
-
-        def _cleanup():
-            try:
-                popup.hide()
-                popup.deleteLater()
-            except Exception:
-                pass
-
-        anim.finished.connect(_cleanup)
-        anim.start()
+        pix = AssetCache().pixmap("rect1.png", self.ui_scale, self.devicePixelRatioF())
+        self._completion_overlay.show_popup(title, pix, duration_ms if duration_ms is not None else 2000)
 
     def _setup_complete_sound(self, sound_path: str) -> None:
-        if not os.path.exists(sound_path):
-            return
-        ext = os.path.splitext(sound_path)[1].lower()
-        if ext in (".wav", ".ogg"):
-            snd = QSoundEffect(self)
-            snd.setSource(QUrl.fromLocalFile(sound_path))
-            snd.setVolume(0.6)
-            self._complete_sound = snd
-            return
-        # mp3 は QMediaPlayer を使う
-        audio = QAudioOutput(self)
-        audio.setVolume(0.6)
-        player = QMediaPlayer(self)
-        player.setAudioOutput(audio)
-        player.setSource(QUrl.fromLocalFile(sound_path))
-        self._complete_audio = audio
-        self._complete_player = player
+        self._sounds.load("complete", sound_path, volume=0.6)
 
     def _play_complete_sound(self) -> None:
-        if self._complete_sound is not None:
-            if self._complete_sound.isLoaded():
-                self._complete_sound.play()
-            return
-        if self._complete_player is not None:
-            self._complete_player.stop()
-            self._complete_player.play()
+        self._sounds.play("complete")
 
     def _setup_lift_sound(self, sound_path: str) -> None:
-        if not os.path.exists(sound_path):
-            return
-        ext = os.path.splitext(sound_path)[1].lower()
-        if ext in (".wav", ".ogg"):
-            snd = QSoundEffect(self)
-            snd.setSource(QUrl.fromLocalFile(sound_path))
-            snd.setVolume(0.4)
-            self._lift_sound = snd
-            return
-        audio = QAudioOutput(self)
-        audio.setVolume(0.4)
-        player = QMediaPlayer(self)
-        player.setAudioOutput(audio)
-        player.setSource(QUrl.fromLocalFile(sound_path))
-        self._lift_audio = audio
-        self._lift_player = player
+        self._sounds.load("lift", sound_path, volume=0.4)
 
     def _play_lift_sound(self) -> None:
-        if self._lift_sound is not None:
-            if self._lift_sound.isLoaded():
-                self._lift_sound.play()
-            return
-        if self._lift_player is not None:
-            self._lift_player.stop()
-            self._lift_player.play()
+        self._sounds.play("lift")
 
     def _build_menu_contents(self) -> None:
         """上端メニューの仮コンテンツを構築。"""
@@ -1266,6 +1619,13 @@ class Shibarania(QWidget):
         theme_btn.clicked.connect(self._action_toggle_theme)
         self._menu_panel_layout.addWidget(theme_btn)
 
+        sync_btn = QPushButton("今すぐ同期", self._menu_panel)
+        sync_btn.setStyleSheet(
+            "QPushButton { background-color: rgba(255,255,255,0.12); color: white; padding: 8px; }"
+        )
+        sync_btn.clicked.connect(self._action_sync_now)
+        self._menu_panel_layout.addWidget(sync_btn)
+
         exit_btn = QPushButton("終了", self._menu_panel)
         exit_btn.setStyleSheet(
             "QPushButton { background-color: rgba(255,255,255,0.12); color: white; padding: 8px; }"
@@ -1327,7 +1687,7 @@ class Shibarania(QWidget):
         title.setStyleSheet("font-size: 18px; font-weight: bold; margin-bottom: 8px; border: none; background: transparent;")
         container_layout.addWidget(title)
         
-        for t in self.tasks.get("完了済みのタスク", [])[:5]:
+        for t in self._store.head("完了済みのタスク", self.history_size):
             card = QFrame(container)
             card.setObjectName("CompletedCard") # QSSで装飾
             
@@ -1439,6 +1799,11 @@ class Shibarania(QWidget):
         anim.finished.connect(_finish)
         anim.start()
 
+    def _action_sync_now(self) -> None:
+        self._hide_menu_panel()
+        self._note_user_activity()
+        self._sync_google_in_background(force=True)
+
     def _action_exit(self) -> None:
         app = QApplication.instance()
         if app is not None:
@@ -1454,6 +1819,16 @@ class Shibarania(QWidget):
         if self._edge_mode == "top":
             self._hide_menu_panel()
 
+    def event(self, a0):
+        # 計測モードでは再描画一式（UpdateRequest）の処理時間をフレーム時間として記録する
+        perf = getattr(self, "_perf", None)  # QWidget.__init__ 中にも呼ばれる
+        if perf is not None and a0 is not None and a0.type() == QEvent.Type.UpdateRequest:
+            t0 = time.perf_counter()
+            handled = super().event(a0)
+            perf.record_frame((time.perf_counter() - t0) * 1000)
+            return handled
+        return super().event(a0)
+
     def eventFilter(self, a0, a1):
         if a1 is None:
             return super().eventFilter(a0, a1)
@@ -1463,6 +1838,7 @@ class Shibarania(QWidget):
                 self._hide_menu_panel()
                 return True
         if a1.type() == QEvent.Type.MouseButtonPress and isinstance(a1, QMouseEvent):
+            self._note_user_activity()
             pos = a1.pos()
             if pos.x() >= self.width() - 60:
                 self._edge_mode = "right"
@@ -1509,9 +1885,29 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(True)
     fullscreen = "--fullscreen" in sys.argv or "-f" in sys.argv
-    window = Shibarania(fullscreen=fullscreen)
+    # 効果音のレイテンシ計測（play() から再生開始までを標準エラーへ出力）
+    measure_sound_latency = "--sound-latency" in sys.argv
+    # 計測オーバーレイ（フレーム時間/イベントループ遅延/ウィジェット数/処理時間。perf.log にも記録）
+    perf_overlay = "--perf" in sys.argv
+    # UI スレッド停止の監視（--watchdog または --watchdog=しきい値ms。stall_report.txt に集計）
+    watchdog: StallWatchdog | None = None
+    for arg in sys.argv[1:]:
+        if arg == "--watchdog" or arg.startswith("--watchdog="):
+            _, _, value = arg.partition("=")
+            threshold_ms = int(value) if value.isdigit() else 100
+            watchdog = StallWatchdog(app, threshold_ms=threshold_ms)
+    window = Shibarania(
+        fullscreen=fullscreen, measure_sound_latency=measure_sound_latency, perf_overlay=perf_overlay
+    )
     if fullscreen:
         window.showFullScreen()
     else:
         window.show()
-    sys.exit(app.exec())
+    code = app.exec()
+    # 送信待ちジャーナルの書き込みを終えてから終了する
+    window._outbox.flush(timeout=2.0)
+    if watchdog is not None:
+        watchdog.stop()
+    if measure_sound_latency:
+        print(window._sounds.latency_report(), file=sys.stderr)
+    sys.exit(code)
@@ -0,0 +1,320 @@
+# SPDX-License-Identifier: MIT
+"""完了/未完了の変更を永続化する送信待ちキュー（ライトアヘッドジャーナル）。
+
+変更はまず追記専用の JSONL に記録してから、バックグラウンドの送信スレッドが
+Google Tasks へまとめて反映する。オフライン中や 429/5xx の間も変更は失われない。
+ジャーナルへの書き込み（fsync・書き直し）は専用の書き込みスレッドで行い、record() を呼ぶ
+UI スレッドはディスクを待たない。送信スレッドは fsync 済みの変更だけを取り出すので、
+ジャーナルに残っていない変更がサーバーへ送られることはない（ライトアヘッドを保つ）。
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import backend
+
+OUTBOX_FILE = "outbox.jsonl"  # token.json と同じ場所に置く送信待ちジャーナル
+COMPACT_THRESHOLD = 200       # ジャーナルの行数がこれを超えたら書き直す
+
+
+class StatusOutbox:
+    """タスクごとに 1 件へ畳み込まれる送信待ちキュー。
+
+    - 同じタスクへの連続した変更は最後の状態にまとめる
+    - 送信前に元の状態（base）へ戻った変更は打ち消し合って消える
+    - 送信中のタスクに新しい変更が来た場合は、送信完了後に続けて送る
+    """
+
+    def __init__(self, path: str = OUTBOX_FILE):
+        self.path = path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._inflight: set[str] = set()
+        self._seq = 0
+        self._lines = 0
+        lock = threading.RLock()
+        self._cond = threading.Condition(lock)
+        # 書き込みスレッド用（状態と同じロックを共有する）
+        self._journal_cond = threading.Condition(lock)
+        self._pending_records: List[Dict[str, Any]] = []
+        self._writing = False
+        # ジャーナルに渡した記録の通し番号と、fsync 済みの位置。タスク ID → 最後の put の位置
+        self._appended = 0
+        self._flushed = 0
+        self._journal_pos: Dict[str, int] = {}
+        self._load()
+        threading.Thread(target=self._run_writer, daemon=True).start()
+
+    def _load(self) -> None:
+        """ジャーナルを再生して送信待ちの状態を復元する。"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except OSError:
+            return
+        for line in lines:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                # 書き込み途中で落ちた末尾行などは読み飛ばす
+                continue
+            task_id = rec.get("task_id")
+            seq = int(rec.get("seq", 0))
+            self._seq = max(self._seq, seq)
+            if rec.get("op") == "put" and task_id:
+                cur = self._entries.get(task_id)
+                if cur is not None and cur["seq"] > seq:
+                    continue
+                self._entries[task_id] = {
+                    "task_id": task_id,
+                    "tasklist_id": rec.get("tasklist_id"),
+                    "status": rec.get("status"),
+                    "base": rec.get("base"),
+                    "seq": seq,
+                }
+            elif rec.get("op") == "del" and task_id:
+                cur = self._entries.get(task_id)
+                if cur is not None and cur["seq"] <= seq:
+                    del self._entries[task_id]
+        self._lines = len(self._entries)
+        self._write_compacted(self._sorted_entries())
+
+    def _sorted_entries(self) -> List[Dict[str, Any]]:
+        return [dict(e, op="put") for e in sorted(self._entries.values(), key=lambda e: e["seq"])]
+
+    def _append(self, rec: Dict[str, Any]) -> None:
+        """記録を書き込みスレッドへ渡す（ロック保持中に呼ばれる。ディスクには触れない）。"""
+        self._pending_records.append(rec)
+        self._appended += 1
+        self._journal_cond.notify_all()
+
+    def _run_writer(self) -> None:
+        """溜まった記録をまとめて追記し、1 回だけ fsync する。行数が増えたら書き直す。"""
+        while True:
+            with self._journal_cond:
+                while not self._pending_records:
+                    self._journal_cond.wait()
+                records = self._pending_records
+                self._pending_records = []
+                upto = self._appended
+                self._writing = True
+                compacted: Optional[List[Dict[str, Any]]] = None
+                if not self._entries or self._lines + len(records) > COMPACT_THRESHOLD:
+                    # 現在の状態は溜まっていた記録をすべて反映済みなので、それだけを書けばよい
+                    compacted = self._sorted_entries()
+                    self._lines = len(compacted)
+                else:
+                    self._lines += len(records)
+            if compacted is not None:
+                self._write_compacted(compacted)
+            else:
+                self._write_records(records)
+            with self._journal_cond:
+                self._writing = False
+                self._flushed = upto
+                self._journal_cond.notify_all()
+                # fsync を待っていた送信スレッドを起こす
+                self._cond.notify_all()
+
+    def _write_records(self, records: List[Dict[str, Any]]) -> None:
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(rec, ensure_ascii=False) + "\n" for rec in records))
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError:
+            pass
+
+    def _write_compacted(self, records: List[Dict[str, Any]]) -> None:
+        """現在の送信待ちだけを残してジャーナルをアトミックに書き直す。"""
+        tmp_path = self.path + ".tmp"
+        try:
+            if not records:
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+                return
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for rec in records:
+                    f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """書き込みスレッドに渡した記録がディスクへ書かれるまで待つ（終了時用）。"""
+        with self._journal_cond:
+            return self._journal_cond.wait_for(
+                lambda: not self._pending_records and not self._writing, timeout
+            )
+
+    def _put(self, entry: Dict[str, Any]) -> None:
+        self._entries[entry["task_id"]] = entry
+        self._append(dict(entry, op="put"))
+        self._journal_pos[entry["task_id"]] = self._appended
+
+    def _delete(self, task_id: str) -> None:
+        entry = self._entries.pop(task_id, None)
+        self._journal_pos.pop(task_id, None)
+        if entry is not None:
+            self._append({"op": "del", "task_id": task_id, "seq": entry["seq"]})
+
+    def record(self, tasklist_id: str, task_id: str, status: str, base_status: str) -> None:
+        """変更を記録する。base_status は変更前（サーバー側とみなせる）の状態。"""
+        with self._cond:
+            self._seq += 1
+            cur = self._entries.get(task_id)
+            if cur is None:
+                if status == base_status:
+                    return
+                entry = {
+                    "task_id": task_id,
+                    "tasklist_id": tasklist_id,
+                    "status": status,
+                    "base": base_status,
+                    "seq": self._seq,
+                }
+            else:
+                if status == cur["base"] and task_id not in self._inflight:
+                    # 未送信のまま元に戻った：完了→取り消しなどは打ち消し合う
+                    self._delete(task_id)
+                    return
+                entry = dict(cur, status=status, seq=self._seq)
+            self._put(entry)
+            self._cond.notify_all()
+
+    def pending_status(self, task_id: str) -> Optional[str]:
+        with self._cond:
+            entry = self._entries.get(task_id)
+            return entry["status"] if entry else None
+
+    def pending_targets(self) -> Dict[str, str]:
+        """送信待ちのタスク ID → 最終的な status。"""
+        with self._cond:
+            return {task_id: e["status"] for task_id, e in self._entries.items()}
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._entries)
+
+    def take_batch(self, limit: int) -> List[Dict[str, Any]]:
+        """送信可能な変更を古い順に最大 limit 件取り出し、送信中にする（無ければ待つ）。
+
+        ジャーナルへの fsync が済んでいない変更は、書き込みが終わるまで取り出さない。
+        """
+        with self._cond:
+            while True:
+                ready = [
+                    e for task_id, e in self._entries.items()
+                    if task_id not in self._inflight and self._journal_pos.get(task_id, 0) <= self._flushed
+                ]
+                if ready:
+                    break
+                self._cond.wait()
+            ready.sort(key=lambda e: e["seq"])
+            batch = [dict(e) for e in ready[:limit]]
+            self._inflight.update(e["task_id"] for e in batch)
+            return batch
+
+    def ack(self, sent: Dict[str, Any]) -> None:
+        """送信成功。送信中に新しい変更が来ていれば、送信済みの状態を新しい base にする。"""
+        with self._cond:
+            task_id = sent["task_id"]
+            self._inflight.discard(task_id)
+            cur = self._entries.get(task_id)
+            if cur is None:
+                return
+            if cur["seq"] == sent["seq"] or cur["status"] == sent["status"]:
+                self._delete(task_id)
+            else:
+                self._put(dict(cur, base=sent["status"]))
+            self._cond.notify_all()
+
+    def release(self, sent: Dict[str, Any]) -> None:
+        """一時的な失敗。送信待ちに戻して後で再送する。"""
+        with self._cond:
+            self._inflight.discard(sent["task_id"])
+            self._cond.notify_all()
+
+    def drop(self, sent: Dict[str, Any]) -> None:
+        """恒久的な失敗。変更を破棄する（サーバー側は base のまま）。"""
+        with self._cond:
+            task_id = sent["task_id"]
+            self._inflight.discard(task_id)
+            cur = self._entries.get(task_id)
+            if cur is None:
+                return
+            if cur["seq"] == sent["seq"] or cur["status"] == cur["base"]:
+                self._delete(task_id)
+            self._cond.notify_all()
+
+
+class OutboxSender:
+    """StatusOutbox をバックグラウンドで送信するスレッド。
+
+    send(tasklist_id, [(task_id, status), ...]) は backend.apply_status_changes と同じ形式の
+    結果リストを返す。429/5xx や通信エラーはジッター付き指数バックオフで再送し、
+    それ以外のエラーは破棄して on_result(task_id, status, error_message) で通知する。
+    """
+
+    def __init__(
+        self,
+        outbox: StatusOutbox,
+        send: Callable[[str, List[Tuple[str, str]]], List[Dict[str, Any]]],
+        on_result: Callable[[str, str, str], None],
+        batch_size: int = backend.BATCH_MAX_SIZE,
+        base_delay_sec: float = 2.0,
+        max_delay_sec: float = 300.0,
+    ):
+        self.outbox = outbox
+        self.send = send
+        self.on_result = on_result
+        self.batch_size = batch_size
+        self.base_delay_sec = base_delay_sec
+        self.max_delay_sec = max_delay_sec
+        self._failures = 0
+
+    def start(self) -> None:
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _backoff_delay(self) -> float:
+        # ジッター付き: [cap/2, cap) の一様乱数（cap = min(max, base * 2^n)）
+        cap = min(self.max_delay_sec, self.base_delay_sec * (2 ** self._failures))
+        return random.uniform(cap / 2, cap)
+
+    def _run(self) -> None:
+        while True:
+            batch = self.outbox.take_batch(self.batch_size)
+            groups: Dict[str, List[Dict[str, Any]]] = {}
+            for entry in batch:
+                groups.setdefault(entry["tasklist_id"], []).append(entry)
+            should_backoff = False
+            for tasklist_id, entries in groups.items():
+                try:
+                    results = self.send(tasklist_id, [(e["task_id"], e["status"]) for e in entries])
+                except Exception as e:
+                    results = [{"ok": False, "error": e} for _ in entries]
+                for entry, res in zip(entries, results):
+                    if res.get("ok"):
+                        self.outbox.ack(entry)
+                        self.on_result(entry["task_id"], entry["status"], "")
+                        continue
+                    err = res.get("error")
+                    status = backend.http_error_status(err)
+                    if status is None or status in backend.RETRYABLE_STATUSES:
+                        self.outbox.release(entry)
+                        should_backoff = True
+                    else:
+                        self.outbox.drop(entry)
+                        self.on_result(entry["task_id"], entry["status"], str(err) or err.__class__.__name__)
+            if should_backoff:
+                self._failures += 1
+                time.sleep(self._backoff_delay())
+            else:
+                self._failures = 0
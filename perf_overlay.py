@@ -0,0 +1,151 @@
+# SPDX-License-Identifier: MIT
+"""UI スレッドの計測用オーバーレイ（--perf で有効化）。
+
+- フレーム時間: トップレベルウィジェットの UpdateRequest（再描画一式）の処理時間
+- イベントループの遅延: 一定間隔のタイマーが予定からどれだけ遅れて発火したか
+- ウィジェット数: QApplication.allWidgets() の件数
+- 区間計測: refresh_ui / 同期結果の反映 / ドロップ処理などの直近 N 回の所要時間
+
+同じ内容をローテーション付きのログファイル（既定 perf.log）にも書き出す。
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from logging.handlers import RotatingFileHandler
+from typing import Deque, Dict, Iterator, Optional
+
+from PyQt6.QtCore import QObject, Qt, QTimer
+from PyQt6.QtWidgets import QApplication, QLabel, QWidget
+
+PERF_LOG_FILE = "perf.log"
+PERF_LOG_MAX_BYTES = 1_000_000
+PERF_LOG_BACKUPS = 3
+
+
+class PerfMonitor(QObject):
+    """計測値の収集とオーバーレイ表示。
+
+    フレーム時間は計測対象ウィジェット側から record_frame() で渡してもらう
+    （UpdateRequest の処理前後で時間を測る必要があるため）。
+    """
+
+    def __init__(
+        self,
+        window: QWidget,
+        history: int = 10,
+        lag_interval_ms: int = 50,
+        overlay_interval_ms: int = 500,
+        log_interval_ms: int = 5000,
+        log_path: str = PERF_LOG_FILE,
+    ):
+        super().__init__(window)
+        self._window = window
+        self._history = history
+        self._frames: Deque[float] = deque(maxlen=120)
+        self._lags: Deque[float] = deque(maxlen=120)
+        self._spans: Dict[str, Deque[float]] = {}
+
+        self._logger = logging.getLogger("shibarania.perf")
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        if not self._logger.handlers:
+            try:
+                handler = RotatingFileHandler(
+                    log_path, maxBytes=PERF_LOG_MAX_BYTES, backupCount=PERF_LOG_BACKUPS, encoding="utf-8"
+                )
+                handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+                self._logger.addHandler(handler)
+            except OSError:
+                pass
+
+        # タイマーのずれでイベントループの詰まりを測る
+        self._lag_interval_ms = lag_interval_ms
+        self._lag_expected = time.perf_counter() + lag_interval_ms / 1000.0
+        self._lag_timer = QTimer(self)
+        self._lag_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._lag_timer.timeout.connect(self._on_lag_tick)
+        self._lag_timer.start(lag_interval_ms)
+
+        self._label = QLabel(window)
+        self._label.setObjectName("PerfOverlay")
+        self._label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self._label.setStyleSheet(
+            "QLabel#PerfOverlay { background-color: rgba(0, 0, 0, 170); color: #7CFC7C;"
+            " font-family: monospace; font-size: 12px; padding: 6px; border-radius: 6px; }"
+        )
+        self._label.move(8, 8)
+        self._label.show()
+
+        self._overlay_timer = QTimer(self)
+        self._overlay_timer.timeout.connect(self._update_overlay)
+        self._overlay_timer.start(overlay_interval_ms)
+        self._log_timer = QTimer(self)
+        self._log_timer.timeout.connect(self._log_summary)
+        self._log_timer.start(log_interval_ms)
+
+    # --- 計測 ---
+    def record_frame(self, duration_ms: float) -> None:
+        self._frames.append(duration_ms)
+
+    def record_span(self, name: str, duration_ms: float) -> None:
+        spans = self._spans.get(name)
+        if spans is None:
+            spans = self._spans[name] = deque(maxlen=self._history)
+        spans.append(duration_ms)
+        self._logger.info("span %s %.2fms", name, duration_ms)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_span(name, (time.perf_counter() - t0) * 1000)
+
+    def _on_lag_tick(self) -> None:
+        now = time.perf_counter()
+        self._lags.append(max(0.0, (now - self._lag_expected) * 1000))
+        self._lag_expected = now + self._lag_interval_ms / 1000.0
+
+    # --- 表示/ログ ---
+    @staticmethod
+    def _stats(values) -> str:
+        if not values:
+            return "-"
+        ordered = sorted(values)
+        return f"avg {sum(ordered) / len(ordered):5.1f} max {ordered[-1]:5.1f}"
+
+    def _summary_lines(self) -> list[str]:
+        lines = [
+            f"frame ms   {self._stats(self._frames)}",
+            f"lag ms     {self._stats(self._lags)}",
+            f"widgets    {len(QApplication.allWidgets())}",
+        ]
+        for name, values in sorted(self._spans.items()):
+            recent = " ".join(f"{v:.1f}" for v in values)
+            lines.append(f"{name:<10} {recent}")
+        return lines
+
+    def _update_overlay(self) -> None:
+        self._label.setText("\n".join(self._summary_lines()))
+        self._label.adjustSize()
+        self._label.raise_()
+
+    def _log_summary(self) -> None:
+        self._logger.info(
+            "frame[%s] lag[%s] widgets=%d",
+            self._stats(self._frames),
+            self._stats(self._lags),
+            len(QApplication.allWidgets()),
+        )
+
+
+def perf_span(monitor: Optional[PerfMonitor], name: str):
+    """monitor が無い（計測無効）ときは何もしないコンテキストマネージャを返す。"""
+    if monitor is None:
+        return nullcontext()
+    return monitor.span(name)
@@ -0,0 +1,64 @@
+# SPDX-License-Identifier: MIT
+"""ボード表示用タスクのスナップショット（起動直後の即時描画用）。
+
+最後に同期に成功したときの「現在のタスク」「完了済みのタスク」を
+コンパクトな JSON（1 タスク = 1 配列）で保存し、次回起動時はネットワークを待たずに描画する。
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+SNAPSHOT_FILE = "board_snapshot.json"
+SNAPSHOT_VERSION = 2
+
+# 1 タスクあたりの列順
+_FIELDS = ("id", "title", "description", "completed", "updated")
+
+
+def _pack(tasks: List[Dict[str, Any]]) -> List[List[Any]]:
+    return [[t.get(f) for f in _FIELDS] for t in tasks]
+
+
+def _unpack(rows: Any) -> List[Dict[str, Any]]:
+    if not isinstance(rows, list):
+        raise ValueError("invalid snapshot rows")
+    tasks = []
+    for row in rows:
+        if not isinstance(row, list) or len(row) != len(_FIELDS):
+            raise ValueError("invalid snapshot row")
+        t = dict(zip(_FIELDS, row))
+        t["title"] = t.get("title") or "(無題)"
+        t["description"] = t.get("description") or ""
+        tasks.append(t)
+    return tasks
+
+
+def encode_snapshot(tasklist_id: Optional[str], current: List[Dict[str, Any]], done: List[Dict[str, Any]]) -> bytes:
+    data = {"v": SNAPSHOT_VERSION, "list": tasklist_id, "current": _pack(current), "done": _pack(done)}
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def save_snapshot(data: bytes, path: str = SNAPSHOT_FILE) -> None:
+    """encode_snapshot() の結果をアトミックに保存する。"""
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def load_snapshot(path: str = SNAPSHOT_FILE) -> Optional[Tuple[Optional[str], List[Dict[str, Any]], List[Dict[str, Any]]]]:
+    """保存済みスナップショットを (tasklist_id, current, done) で返す。無い/壊れている場合は None。"""
+    try:
+        with open(path, "rb") as f:
+            data = json.loads(f.read())
+        if not isinstance(data, dict) or data.get("v") != SNAPSHOT_VERSION:
+            return None
+        return data.get("list"), _unpack(data.get("current")), _unpack(data.get("done"))
+    except (OSError, ValueError):
+        return None
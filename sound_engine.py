@@ -0,0 +1,255 @@
+# SPDX-License-Identifier: MIT
+"""効果音の再生（低レイテンシ用）。
+
+mp3 を再生のたびに QMediaPlayer（デコーダ＋メディアパイプライン）に通すと、
+持ち上げから音が鳴るまでに遅れが出るうえ、連続した操作で音が重ならない。
+ここでは起動時に一度だけ QAudioDecoder で PCM に展開して WAV としてキャッシュし、
+同じ音源を複数の QSoundEffect（ボイス）に読み込んでおいて空いているものから鳴らす。
+デコード完了前/失敗時は従来どおり QMediaPlayer で鳴らす。
+"""
+
+from __future__ import annotations
+
+import array
+import os
+import sys
+import time
+import wave
+from typing import Dict, List, Optional
+
+from PyQt6.QtCore import QObject, QUrl
+from PyQt6.QtMultimedia import QAudioDecoder, QAudioFormat, QAudioOutput, QMediaPlayer, QSoundEffect
+
+# assets/ と同じくアプリのディレクトリ基準（起動時のカレントディレクトリに依存しない）
+SOUND_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sound_cache")
+DEFAULT_VOICES = 3
+PCM_SAMPLE_RATE = 44100
+PCM_CHANNELS = 2
+
+
+def _cached_wav_path(source_path: str, cache_dir: str) -> str:
+    """デコード済み WAV のパス。元ファイルのサイズと更新時刻を含め、差し替え時は作り直す。"""
+    st = os.stat(source_path)
+    base = os.path.splitext(os.path.basename(source_path))[0]
+    return os.path.join(cache_dir, f"{base}-{st.st_size}-{int(st.st_mtime)}.wav")
+
+
+def _buffer_to_int16(buffer) -> Optional[bytes]:
+    """QAudioBuffer の中身を 16bit 整数 PCM のバイト列にする（未対応の形式は None）。"""
+    fmt = buffer.format()
+    raw = buffer.constData().asstring(buffer.byteCount())
+    if fmt.sampleFormat() == QAudioFormat.SampleFormat.Int16:
+        return raw
+    if fmt.sampleFormat() == QAudioFormat.SampleFormat.Float:
+        floats = array.array("f")
+        floats.frombytes(raw)
+        return array.array("h", (int(max(-1.0, min(1.0, v)) * 32767) for v in floats)).tobytes()
+    return None
+
+
+class _Sound(QObject):
+    """1 つの効果音。デコード済みなら複数ボイスの QSoundEffect、それまでは QMediaPlayer で鳴らす。"""
+
+    def __init__(self, engine: "SoundEngine", name: str, source_path: str, volume: float, voices: int):
+        super().__init__(engine)
+        self._engine = engine
+        self.name = name
+        self._source_path = source_path
+        self._volume = volume
+        self._voice_count = max(1, voices)
+        self._voices: List[QSoundEffect] = []
+        self._next_voice = 0
+        self._player: Optional[QMediaPlayer] = None
+        self._audio: Optional[QAudioOutput] = None
+        self._decoder: Optional[QAudioDecoder] = None
+        self._pcm = bytearray()
+        self._pcm_format: Optional[QAudioFormat] = None
+
+    # --- 読み込み ---
+    def load(self) -> None:
+        ext = os.path.splitext(self._source_path)[1].lower()
+        if ext == ".wav":
+            self._setup_voices(self._source_path)
+            return
+        try:
+            wav_path = _cached_wav_path(self._source_path, self._engine.cache_dir)
+        except OSError:
+            return
+        if os.path.exists(wav_path):
+            self._setup_voices(wav_path)
+            return
+        # デコードが終わるまでは従来の経路で鳴らす
+        self._setup_player()
+        self._start_decode(wav_path)
+
+    def _setup_voices(self, wav_path: str) -> None:
+        url = QUrl.fromLocalFile(os.path.abspath(wav_path))
+        voices = []
+        for _ in range(self._voice_count):
+            snd = QSoundEffect(self)
+            snd.setSource(url)
+            snd.setVolume(self._volume)
+            snd.playingChanged.connect(self._on_voice_playing_changed)
+            voices.append(snd)
+        self._voices = voices
+
+    def _setup_player(self) -> None:
+        audio = QAudioOutput(self)
+        audio.setVolume(self._volume)
+        player = QMediaPlayer(self)
+        player.setAudioOutput(audio)
+        player.setSource(QUrl.fromLocalFile(self._source_path))
+        player.playbackStateChanged.connect(self._on_player_state_changed)
+        self._audio = audio
+        self._player = player
+
+    def _start_decode(self, wav_path: str) -> None:
+        fmt = QAudioFormat()
+        fmt.setSampleRate(PCM_SAMPLE_RATE)
+        fmt.setChannelCount(PCM_CHANNELS)
+        fmt.setSampleFormat(QAudioFormat.SampleFormat.Int16)
+        decoder = QAudioDecoder(self)
+        decoder.setAudioFormat(fmt)
+        decoder.setSource(QUrl.fromLocalFile(self._source_path))
+        decoder.bufferReady.connect(self._on_buffer_ready)
+        decoder.finished.connect(lambda: self._on_decode_finished(wav_path))
+        try:
+            decoder.error.connect(self._on_decode_error)
+        except (AttributeError, TypeError):
+            # PyQt のバージョンによっては error がゲッターのみ（失敗時は finished も来ないのでフォールバックのまま）
+            pass
+        self._decoder = decoder
+        decoder.start()
+
+    def _on_buffer_ready(self) -> None:
+        decoder = self._decoder
+        if decoder is None:
+            return
+        buffer = decoder.read()
+        if not buffer.isValid():
+            return
+        pcm = _buffer_to_int16(buffer)
+        if pcm is None:
+            self._on_decode_error()
+            return
+        self._pcm_format = buffer.format()
+        self._pcm.extend(pcm)
+
+    def _on_decode_finished(self, wav_path: str) -> None:
+        decoder, self._decoder = self._decoder, None
+        if decoder is not None:
+            decoder.deleteLater()
+        fmt = self._pcm_format
+        if fmt is None or not self._pcm:
+            return
+        try:
+            os.makedirs(os.path.dirname(wav_path) or ".", exist_ok=True)
+            tmp_path = wav_path + ".tmp"
+            with wave.open(tmp_path, "wb") as w:
+                w.setnchannels(fmt.channelCount())
+                w.setsampwidth(2)
+                w.setframerate(fmt.sampleRate())
+                w.writeframes(bytes(self._pcm))
+            os.replace(tmp_path, wav_path)
+        except (OSError, wave.Error):
+            return
+        finally:
+            self._pcm = bytearray()
+        self._setup_voices(wav_path)
+
+    def _on_decode_error(self, *args) -> None:
+        # デコードできない環境では QMediaPlayer のまま使う
+        decoder, self._decoder = self._decoder, None
+        if decoder is not None:
+            decoder.stop()
+            decoder.deleteLater()
+        self._pcm = bytearray()
+
+    # --- 再生 ---
+    def _ready_voices(self) -> List[QSoundEffect]:
+        return [v for v in self._voices if v.isLoaded()]
+
+    def play(self) -> None:
+        voices = self._ready_voices()
+        if voices:
+            # 空いているボイスを優先し、全部鳴っていれば順番に鳴らし直す
+            idle = [v for v in voices if not v.isPlaying()]
+            if idle:
+                voice = idle[0]
+            else:
+                voice = voices[self._next_voice % len(voices)]
+                self._next_voice += 1
+                voice.stop()
+            self._engine._mark_requested(self, voice)
+            voice.play()
+            return
+        if self._player is not None:
+            self._engine._mark_requested(self, self._player)
+            self._player.stop()
+            self._player.play()
+
+    def _on_voice_playing_changed(self) -> None:
+        sender = self.sender()
+        if isinstance(sender, QSoundEffect) and sender.isPlaying():
+            self._engine._mark_started(self, sender, "voice")
+
+    def _on_player_state_changed(self, state) -> None:
+        if state == QMediaPlayer.PlaybackState.PlayingState:
+            self._engine._mark_started(self, self._player, "player")
+
+
+class SoundEngine(QObject):
+    """効果音の登録と再生。
+
+    measure_latency=True の場合、play() から再生開始（playingChanged）までの時間を記録し、
+    1 回ごとに標準エラーへ出力する。開始時刻は再生に使ったボイスごとに持つので、
+    同じ効果音が重なって鳴っても取り違えない。latency_report() で集計を取得できる。
+    """
+
+    def __init__(self, parent: Optional[QObject] = None, voices: int = DEFAULT_VOICES,
+                 cache_dir: str = SOUND_CACHE_DIR, measure_latency: bool = False):
+        super().__init__(parent)
+        self.voices = voices
+        self.cache_dir = cache_dir
+        self.measure_latency = measure_latency
+        self._sounds: Dict[str, _Sound] = {}
+        # 再生に使ったボイス（QSoundEffect / QMediaPlayer）→ play() を呼んだ時刻
+        self._requested_at: Dict[QObject, float] = {}
+        self._latencies: Dict[str, List[float]] = {}
+
+    def load(self, name: str, source_path: str, volume: float = 1.0) -> None:
+        """効果音を登録する。mp3 などは初回のみ WAV にデコードしてキャッシュする。"""
+        if not os.path.exists(source_path):
+            return
+        sound = _Sound(self, name, source_path, volume, self.voices)
+        self._sounds[name] = sound
+        sound.load()
+
+    def play(self, name: str) -> None:
+        sound = self._sounds.get(name)
+        if sound is not None:
+            sound.play()
+
+    # --- レイテンシ計測 ---
+    def _mark_requested(self, sound: _Sound, voice: QObject) -> None:
+        if self.measure_latency:
+            # 鳴っている途中のボイスを鳴らし直した場合は、前回の計測を新しい play() で置き換える
+            self._requested_at[voice] = time.perf_counter()
+
+    def _mark_started(self, sound: _Sound, voice: QObject, path: str) -> None:
+        if not self.measure_latency:
+            return
+        t0 = self._requested_at.pop(voice, None)
+        if t0 is None:
+            return
+        ms = (time.perf_counter() - t0) * 1000
+        self._latencies.setdefault(f"{sound.name} ({path})", []).append(ms)
+        print(f"[sound] {sound.name} via {path}: {ms:.1f} ms", file=sys.stderr)
+
+    def latency_report(self) -> str:
+        lines = []
+        for key, values in sorted(self._latencies.items()):
+            ordered = sorted(values)
+            p50 = ordered[len(ordered) // 2]
+            lines.append(f"{key}: n={len(values)} p50={p50:.1f}ms max={ordered[-1]:.1f}ms")
+        return "\n".join(lines)
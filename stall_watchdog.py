@@ -0,0 +1,145 @@
+# SPDX-License-Identifier: MIT
+"""UI スレッドの停止（フリーズ）検出。
+
+UI スレッド上のタイマーが一定間隔で心拍を打ち、監視スレッドが心拍の途絶を見張る。
+しきい値（既定 100ms）を超えて途絶えたら、その時点の UI スレッドの Python スタックを
+sys._current_frames() で取得し、同じスタックごとに回数/合計/最大時間を集計してレポートに書き出す。
+長時間（hang_dump_sec 以上）止まった場合は faulthandler で全スレッドのスタックも記録する。
+"""
+
+from __future__ import annotations
+
+import faulthandler
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QTimer
+
+STALL_REPORT_FILE = "stall_report.txt"
+STALL_DUMP_FILE = "stall_faulthandler.log"
+
+# スタックの同一性判定用キー（(ファイル, 行番号, 関数名) の並び）
+StackKey = Tuple[Tuple[str, int, str], ...]
+
+
+class StallWatchdog(QObject):
+    """UI スレッドの停止を検出して集計するウォッチドッグ。UI スレッド上で生成すること。"""
+
+    def __init__(
+        self,
+        parent: Optional[QObject] = None,
+        threshold_ms: int = 100,
+        heartbeat_ms: int = 20,
+        hang_dump_sec: float = 5.0,
+        report_path: str = STALL_REPORT_FILE,
+        dump_path: str = STALL_DUMP_FILE,
+        max_depth: int = 30,
+    ):
+        super().__init__(parent)
+        self.threshold_ms = threshold_ms
+        self.hang_dump_sec = hang_dump_sec
+        self.report_path = report_path
+        self.dump_path = dump_path
+        self.max_depth = max_depth
+        self._ui_ident = threading.get_ident()
+        self._lock = threading.Lock()
+        self._last_beat = time.monotonic()
+        self._stopped = threading.Event()
+        # スタックごとの集計: [回数, 合計 ms, 最大 ms]
+        self._stats: Dict[StackKey, List[float]] = {}
+        self._stall_count = 0
+        self._stall_total_ms = 0.0
+
+        self._heartbeat = QTimer(self)
+        self._heartbeat.timeout.connect(self._beat)
+        self._heartbeat.start(heartbeat_ms)
+        self._thread = threading.Thread(target=self._run, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._heartbeat.stop()
+        self._stopped.set()
+
+    def _beat(self) -> None:
+        with self._lock:
+            self._last_beat = time.monotonic()
+
+    def _since_beat(self) -> Tuple[float, float]:
+        with self._lock:
+            beat = self._last_beat
+        return beat, time.monotonic() - beat
+
+    def _capture_ui_stack(self) -> StackKey:
+        frame = sys._current_frames().get(self._ui_ident)
+        if frame is None:
+            return ()
+        summary = traceback.extract_stack(frame, limit=self.max_depth)
+        return tuple((fs.filename, fs.lineno or 0, fs.name) for fs in summary)
+
+    def _dump_all_threads(self) -> None:
+        try:
+            with open(self.dump_path, "a", encoding="utf-8") as f:
+                f.write(f"--- {time.strftime('%Y-%m-%d %H:%M:%S')} UI thread stalled > {self.hang_dump_sec:.0f}s ---\n")
+                f.flush()
+                faulthandler.dump_traceback(file=f, all_threads=True)
+        except OSError:
+            pass
+
+    def _run(self) -> None:
+        poll = max(0.005, self.threshold_ms / 4000.0)
+        threshold = self.threshold_ms / 1000.0
+        while not self._stopped.wait(poll):
+            beat, elapsed = self._since_beat()
+            if elapsed < threshold:
+                continue
+            # 停止を検出：この時点のスタックを停止の原因として記録する
+            stack = self._capture_ui_stack()
+            dumped = False
+            while not self._stopped.wait(poll):
+                current, elapsed = self._since_beat()
+                if current != beat:
+                    break
+                if not dumped and elapsed >= self.hang_dump_sec:
+                    self._dump_all_threads()
+                    dumped = True
+            self._record(stack, (time.monotonic() - beat) * 1000)
+
+    def _record(self, stack: StackKey, duration_ms: float) -> None:
+        entry = self._stats.get(stack)
+        if entry is None:
+            entry = self._stats[stack] = [0, 0.0, 0.0]
+        entry[0] += 1
+        entry[1] += duration_ms
+        entry[2] = max(entry[2], duration_ms)
+        self._stall_count += 1
+        self._stall_total_ms += duration_ms
+        self._write_report()
+
+    def report(self, top: int = 20) -> str:
+        lines = [
+            f"# UI スレッド停止レポート（しきい値 {self.threshold_ms} ms）",
+            f"停止回数: {self._stall_count}  合計: {self._stall_total_ms:.0f} ms",
+            "",
+        ]
+        ranked = sorted(self._stats.items(), key=lambda kv: kv[1][1], reverse=True)
+        for stack, (count, total_ms, max_ms) in ranked[:top]:
+            lines.append(f"== {int(count)} 回 / 合計 {total_ms:.0f} ms / 最大 {max_ms:.0f} ms ==")
+            if not stack:
+                lines.append("  (スタックを取得できませんでした)")
+            for filename, lineno, name in stack:
+                lines.append(f'  File "{filename}", line {lineno}, in {name}')
+            lines.append("")
+        return "\n".join(lines)
+
+    def _write_report(self) -> None:
+        tmp_path = self.report_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(self.report())
+            os.replace(tmp_path, self.report_path)
+        except OSError:
+            pass
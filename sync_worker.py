@@ -0,0 +1,173 @@
+# SPDX-License-Identifier: MIT
+"""Google Tasks 同期のスケジューラ。
+
+1 本のスレッドを使い回し、同時に来た同期要求は 1 回のフェッチにまとめる。
+直前に取得したばかりなら（鮮度 TTL 内）再取得しない。失敗時はバックオフする。
+同期間隔は操作やリモート変更の直後は短く、変化がない/操作がない間は長くなる。
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+class SyncWorker(QObject):
+    """周期同期とオンデマンド同期をまとめて扱うワーカー。
+
+    fetch はワーカースレッド上で呼ばれ、失敗時は例外を送出すること。
+    リモートに変更があった場合は True を返すと、同期間隔を min_interval_ms に戻す。
+    変更がなければ間隔を interval_growth 倍ずつ max_interval_ms まで広げ、
+    idle_after_ms 以上操作がなければ（夜間など）max_interval_ms で同期する。
+    状態は state_changed シグナル（"idle" / "fetching" / "backoff"）で通知する。
+    """
+
+    STATE_IDLE = "idle"
+    STATE_FETCHING = "fetching"
+    STATE_BACKOFF = "backoff"
+
+    state_changed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        fetch: Callable[[], Optional[bool]],
+        interval_ms: int = 60_000,
+        min_interval_ms: int = 15_000,
+        max_interval_ms: int = 600_000,
+        interval_growth: float = 1.5,
+        idle_after_ms: int = 1_800_000,
+        fresh_ttl_ms: int = 5_000,
+        activity_delay_ms: int = 5_000,
+        backoff_base_ms: int = 5_000,
+        backoff_max_ms: int = 600_000,
+        parent: Optional[QObject] = None,
+    ):
+        super().__init__(parent)
+        self._fetch = fetch
+        self.min_interval_ms = min_interval_ms
+        self.max_interval_ms = max(min_interval_ms, max_interval_ms)
+        self.interval_ms = self._clamp(interval_ms)
+        self.interval_growth = interval_growth
+        self.idle_after_ms = idle_after_ms
+        self.fresh_ttl_ms = fresh_ttl_ms
+        self.activity_delay_ms = activity_delay_ms
+        self.backoff_base_ms = backoff_base_ms
+        self.backoff_max_ms = backoff_max_ms
+        self.state = self.STATE_IDLE
+        self._cond = threading.Condition()
+        self._requested = False
+        self._force = False
+        self._stopped = False
+        self._failures = 0
+        self._last_success: Optional[float] = None
+        self._next_due = 0.0
+        self._last_activity = time.monotonic()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, initial_delay_ms: int = 0) -> None:
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._next_due = time.monotonic() + initial_delay_ms / 1000.0
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+    def request_sync(self, force: bool = False) -> None:
+        """同期を要求する。フェッチ中/鮮度 TTL 内/バックオフ中の要求は force でない限りまとめられる。"""
+        with self._cond:
+            self._requested = True
+            self._force = self._force or force
+            self._cond.notify_all()
+
+    def note_activity(self) -> None:
+        """ローカルでの操作を通知する。同期間隔を最短に戻し、次回同期を前倒しする。
+
+        前倒し先は「前回の同期 + 最短間隔」。ただし操作の直後にすぐ同期はせず、
+        早くても activity_delay_ms 後とする。連続したタップでは最も早い予定を保つだけなので、
+        操作による同期は最短間隔あたり高々 1 回になる。
+        """
+        with self._cond:
+            now = time.monotonic()
+            self._last_activity = now
+            self.interval_ms = self.min_interval_ms
+            if self._failures or self._last_success is None:
+                return
+            due = max(
+                self._last_success + self.min_interval_ms / 1000.0,
+                now + self.activity_delay_ms / 1000.0,
+            )
+            if due < self._next_due:
+                self._next_due = due
+                self._cond.notify_all()
+
+    def _clamp(self, interval_ms: float) -> int:
+        return int(max(self.min_interval_ms, min(self.max_interval_ms, interval_ms)))
+
+    def _next_interval_ms(self, changed: bool, now: float) -> int:
+        if changed:
+            return self.min_interval_ms
+        if (now - self._last_activity) * 1000 >= self.idle_after_ms:
+            return self.max_interval_ms
+        return self._clamp(self.interval_ms * self.interval_growth)
+
+    def _set_state(self, state: str) -> None:
+        if state != self.state:
+            self.state = state
+            self.state_changed.emit(state)
+
+    def _is_fresh(self, now: float) -> bool:
+        return self._last_success is not None and (now - self._last_success) * 1000 < self.fresh_ttl_ms
+
+    def _wait_for_turn(self) -> bool:
+        """次のフェッチを行うべきタイミングまで待つ。停止時は False。"""
+        with self._cond:
+            while not self._stopped:
+                now = time.monotonic()
+                if self._requested:
+                    if self._force:
+                        break
+                    if self._failures and now < self._next_due:
+                        # バックオフ中の要求は予定済みの再試行にまとめる
+                        self._requested = False
+                    elif self._is_fresh(now):
+                        # 取得したばかりなので再取得しない
+                        self._requested = False
+                    else:
+                        break
+                if now >= self._next_due:
+                    break
+                self._cond.wait(self._next_due - now)
+            self._requested = False
+            self._force = False
+            return not self._stopped
+
+    def _backoff_ms(self) -> float:
+        cap = min(self.backoff_max_ms, self.backoff_base_ms * (2 ** (self._failures - 1)))
+        return random.uniform(cap / 2, cap)
+
+    def _run(self) -> None:
+        while self._wait_for_turn():
+            self._set_state(self.STATE_FETCHING)
+            try:
+                changed = bool(self._fetch())
+            except Exception:
+                with self._cond:
+                    self._failures += 1
+                    self._next_due = time.monotonic() + self._backoff_ms() / 1000.0
+                self._set_state(self.STATE_BACKOFF)
+                continue
+            with self._cond:
+                self._failures = 0
+                self._last_success = time.monotonic()
+                self.interval_ms = self._next_interval_ms(changed, self._last_success)
+                self._next_due = self._last_success + self.interval_ms / 1000.0
+            self._set_state(self.STATE_IDLE)
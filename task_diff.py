@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: MIT
+"""同期結果と現在の表示状態の差分計算。
+
+タスクは id（無ければタイトル）で対応付け、updated タイムスタンプで変更を判定する。
+変更がなければ UI 側は何もしなくてよく、変わったセクションだけを描き直せばよい。
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Hashable, List
+
+SECTION_CURRENT = "現在のタスク"
+SECTION_DONE = "完了済みのタスク"
+SECTIONS = (SECTION_CURRENT, SECTION_DONE)
+
+# Google Tasks のタスクの status（backend/task_store で共有する）
+STATUS_COMPLETED = "completed"
+STATUS_NEEDS_ACTION = "needsAction"
+
+
+def task_key(task: Dict[str, Any]) -> Hashable:
+    """タスクの同一性判定用キー（id 優先、ローカルのみのタスクはタイトル）。"""
+    task_id = task.get("id")
+    return task_id if task_id else ("title", task.get("title"))
+
+
+def _is_modified(old: Dict[str, Any], new: Dict[str, Any]) -> bool:
+    if old.get("updated") != new.get("updated"):
+        return True
+    # updated を持たないタスク（スナップショット/ローカル）は表示内容で比較
+    return old.get("title") != new.get("title") or (old.get("description") or "") != (new.get("description") or "")
+
+
+class SectionChanges:
+    """同期結果で内容か並び順が変わったセクションの集合。
+
+    UI は変わったセクションを丸ごと描き直す（現在のタスクはモデル側が表示範囲のカードだけを差分更新する）ので、
+    タスク単位の追加/削除/移動の内訳は持たない。
+    """
+
+    def __init__(self):
+        self.sections: set[str] = set()
+
+    def is_empty(self) -> bool:
+        return not self.sections
+
+    def touched_sections(self) -> set[str]:
+        return set(self.sections)
+
+    def __repr__(self) -> str:
+        return f"SectionChanges(sections={sorted(self.sections)!r})"
+
+
+def _section_changed(old_list: List[Dict[str, Any]], new_list: List[Dict[str, Any]]) -> bool:
+    if len(old_list) != len(new_list):
+        return True
+    # 同じタスクが同じ順に並び、どれも変更されていなければ変化なし
+    return any(task_key(a) != task_key(b) or _is_modified(a, b) for a, b in zip(old_list, new_list))
+
+
+def diff_sections(old: Dict[str, List[Dict[str, Any]]], new: Dict[str, List[Dict[str, Any]]]) -> SectionChanges:
+    """old（現在の表示状態）から new（同期結果）で変わったセクションを求める。
+
+    セクション間の移動は、移動元と移動先の両方が変わったものとして扱う。
+    """
+    changes = SectionChanges()
+    for sec in SECTIONS:
+        if _section_changed(old.get(sec, []), new.get(sec, [])):
+            changes.sections.add(sec)
+    return changes
@@ -0,0 +1,280 @@
+# SPDX-License-Identifier: MIT
+"""画面に表示しているタスクのインデックス付きストア。
+
+タスクは __slots__ のレコードで持ち（1 件あたりの dict を持たない）、
+id → レコード、タイトル → レコード群（同名タスクがあるので多重マップ）、
+セクション → 順序付きメンバー（挿入順を保つ dict を順序付き集合として使う）の索引で
+検索・移動・削除をすべて O(1) で行う。
+
+レコードは get() / [] で dict と同じように読めるので、表示側（TaskWidget や差分計算）はそのまま使える。
+"""
+
+from __future__ import annotations
+
+import heapq
+from datetime import datetime
+from functools import lru_cache
+from itertools import count, islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from task_diff import SECTION_CURRENT, SECTION_DONE, SECTIONS, STATUS_COMPLETED, STATUS_NEEDS_ACTION
+
+_SECTION_STATUS = {SECTION_CURRENT: STATUS_NEEDS_ACTION, SECTION_DONE: STATUS_COMPLETED}
+
+
+@lru_cache(maxsize=4096)
+def parse_rfc3339(value: Optional[str]) -> Optional[datetime]:
+    """Google Tasks の RFC3339 タイムスタンプを datetime にする（不正/未設定は None）。
+
+    同じ文字列は同期のたびに何度も現れるので、解析結果を文字列ごとにキャッシュする。
+    """
+    if not value:
+        return None
+    try:
+        # RFC3339 'Z' を Python 互換に変換
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+class TaskRecord:
+    """1 件のタスク。dict 互換の読み取り（get / []）を提供する。"""
+
+    __slots__ = ("id", "title", "description", "status", "completed", "updated", "completed_at", "updated_at", "section")
+
+    # get() で読める項目
+    FIELDS = ("id", "title", "description", "status", "completed", "updated")
+
+    def __init__(
+        self,
+        title: str,
+        description: str = "",
+        id: Optional[str] = None,
+        completed: Optional[str] = None,
+        updated: Optional[str] = None,
+        section: str = SECTION_CURRENT,
+    ):
+        self.id = id
+        self.title = title
+        self.description = description
+        self.section = section
+        self.status = _SECTION_STATUS.get(section, STATUS_NEEDS_ACTION)
+        self.completed = completed
+        self.updated = updated
+        # ソートや比較のたびに解析しないよう、生成時に一度だけ解析しておく
+        self.completed_at = parse_rfc3339(completed)
+        self.updated_at = parse_rfc3339(updated)
+
+    @classmethod
+    def from_dict(cls, task: Dict[str, Any], section: str) -> "TaskRecord":
+        return cls(
+            task.get("title") or "",
+            task.get("description") or "",
+            task.get("id"),
+            task.get("completed"),
+            task.get("updated"),
+            section,
+        )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.FIELDS:
+            value = getattr(self, key)
+            return default if value is None else value
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "title": self.title,
+            "description": self.description,
+            "id": self.id,
+            "completed": self.completed,
+            "updated": self.updated,
+        }
+
+    def __repr__(self) -> str:
+        return f"TaskRecord(id={self.id!r}, title={self.title!r}, section={self.section!r})"
+
+
+class TaskStore:
+    """セクションごとの並びと id/タイトルの索引を持つタスクストア。"""
+
+    def __init__(self):
+        self._by_id: Dict[str, TaskRecord] = {}
+        # タイトル → 同名レコードの順序付き集合
+        self._by_title: Dict[str, Dict[TaskRecord, None]] = {}
+        # セクション → 順序付き集合（dict のキー順 = 表示順）
+        self._sections: Dict[str, Dict[TaskRecord, None]] = {sec: {} for sec in SECTIONS}
+
+    def __len__(self) -> int:
+        return sum(len(members) for members in self._sections.values())
+
+    # --- 参照 ---
+    def section(self, section: str) -> List[TaskRecord]:
+        return list(self._sections.get(section, ()))
+
+    def head(self, section: str, n: int) -> List[TaskRecord]:
+        """セクションの先頭 n 件（全件コピーしない）。"""
+        return list(islice(self._sections.get(section, ()), n))
+
+    def as_sections(self) -> Dict[str, List[TaskRecord]]:
+        """差分計算用の {セクション: [レコード]}。"""
+        return {sec: self.section(sec) for sec in SECTIONS}
+
+    def find_by_id(self, task_id: Optional[str]) -> Optional[TaskRecord]:
+        if not task_id:
+            return None
+        return self._by_id.get(task_id)
+
+    def find_by_title(self, title: Optional[str]) -> Optional[TaskRecord]:
+        """タイトルが一致するタスク。複数あれば「現在のタスク」側・表示順で先のものを返す。"""
+        records = self._by_title.get(title or "")
+        if not records:
+            return None
+        first = next(iter(records))
+        if first.section == SECTIONS[0]:
+            return first
+        for rec in records:
+            if rec.section == SECTIONS[0]:
+                return rec
+        return first
+
+    def find(self, task_id: Optional[str] = None, title: Optional[str] = None) -> Optional[TaskRecord]:
+        """id があれば id で、無ければタイトルで探す。"""
+        if task_id:
+            return self.find_by_id(task_id)
+        return self.find_by_title(title)
+
+    # --- 変更 ---
+    def add(self, task: Dict[str, Any] | TaskRecord, section: str = SECTION_CURRENT) -> TaskRecord:
+        """セクションの末尾に追加する。同じ id のタスクがあれば置き換える。"""
+        record = task if isinstance(task, TaskRecord) else TaskRecord.from_dict(task, section)
+        if record.id:
+            existing = self._by_id.get(record.id)
+            if existing is not None:
+                self.remove(existing)
+            self._by_id[record.id] = record
+        self._by_title.setdefault(record.title, {})[record] = None
+        record.section = section
+        record.status = _SECTION_STATUS.get(section, STATUS_NEEDS_ACTION)
+        self._sections.setdefault(section, {})[record] = None
+        return record
+
+    def remove(self, record: TaskRecord) -> bool:
+        members = self._sections.get(record.section)
+        if members is None or record not in members:
+            return False
+        del members[record]
+        if record.id and self._by_id.get(record.id) is record:
+            del self._by_id[record.id]
+        same_title = self._by_title.get(record.title)
+        if same_title is not None:
+            same_title.pop(record, None)
+            if not same_title:
+                del self._by_title[record.title]
+        return True
+
+    def move(self, record: TaskRecord, section: str, front: bool = False) -> bool:
+        """レコードを別セクションの末尾（front=True なら先頭）へ移動する。既にそのセクションにあれば何もしない。"""
+        members = self._sections.get(record.section)
+        if members is None or record not in members:
+            return False
+        if record.section == section:
+            return True
+        del members[record]
+        record.section = section
+        record.status = _SECTION_STATUS.get(section, STATUS_NEEDS_ACTION)
+        dest = self._sections.setdefault(section, {})
+        if front:
+            # 先頭への挿入は作り直しになる（完了済みのように件数の少ないセクション向け）
+            self._sections[section] = {record: None, **dest}
+        else:
+            dest[record] = None
+        return True
+
+    def update(self, record: TaskRecord, task: Dict[str, Any]) -> bool:
+        """レコードの内容をその場で書き換える（表示順は変えない）。変化があれば True。"""
+        title = task.get("title") or ""
+        description = task.get("description") or ""
+        completed = task.get("completed")
+        updated = task.get("updated")
+        if (record.title, record.description, record.completed, record.updated) == (title, description, completed, updated):
+            return False
+        if title != record.title:
+            same_title = self._by_title.get(record.title)
+            if same_title is not None:
+                same_title.pop(record, None)
+                if not same_title:
+                    del self._by_title[record.title]
+            self._by_title.setdefault(title, {})[record] = None
+            record.title = title
+        record.description = description
+        record.completed = completed
+        record.updated = updated
+        record.completed_at = parse_rfc3339(completed)
+        record.updated_at = parse_rfc3339(updated)
+        return True
+
+    def replace_section(self, section: str, tasks: Iterable[Dict[str, Any]]) -> None:
+        """セクションの中身を丸ごと差し替える（同期結果/スナップショットの反映用）。"""
+        for record in list(self._sections.get(section, ())):
+            self.remove(record)
+        for task in tasks:
+            self.add(task, section)
+
+
+def _timestamp(value: Optional[str]) -> float:
+    dt = parse_rfc3339(value)
+    return dt.timestamp() if dt is not None else float("-inf")
+
+
+def google_task_entry(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Google Tasks のタスクリソースを表示用の dict にする。"""
+    return {
+        "title": task.get("title") or "(無題)",
+        "description": task.get("notes") or "",
+        "id": task.get("id"),
+        "completed": task.get("completed"),
+        "updated": task.get("updated"),
+    }
+
+
+class SectionAccumulator:
+    """Google Tasks のタスクをページ単位で受け取り、セクションごとの表示用リストを組み立てる。
+
+    未完了タスクはそのまま順に並べ、完了済みは完了日時が新しい history_size 件だけを
+    サイズ上限付きのヒープで保持する。完了済みの履歴が何件あっても、保持するのは N 件だけ。
+    """
+
+    def __init__(self, history_size: int = 2):
+        self.history_size = max(0, history_size)
+        self._current: List[Dict[str, Any]] = []
+        # (完了時刻, -到着順, タスク) の最小ヒープ。同時刻なら後から来たものを先に捨てる
+        self._done_heap: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._seq = count()
+
+    def feed(self, tasks: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """1 ページ分のタスクを取り込み、このページで増えた現在のタスクを返す。"""
+        heap = self._done_heap
+        start = len(self._current)
+        for t in tasks:
+            if t.get("status") != STATUS_COMPLETED:
+                self._current.append(google_task_entry(t))
+                continue
+            if not self.history_size:
+                continue
+            item = (_timestamp(t.get("completed")), -next(self._seq), t)
+            if len(heap) < self.history_size:
+                heapq.heappush(heap, item)
+            elif item[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, item)
+        return self._current[start:]
+
+    def result(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """(現在のタスク, 完了済みのタスク（新しい順）) を返す。"""
+        newest = sorted(self._done_heap, key=lambda item: item[:2], reverse=True)
+        return list(self._current), [google_task_entry(t) for _ts, _seq, t in newest]
@@ -1,6 +1,8 @@
 from PyQt6.QtGui import QColor, QPalette
 from PyQt6.QtCore import Qt
 
+from card_shadow import CARD_RADIUS, CARD_SHADOW_MARGINS
+
 class ThemeColors:
     def __init__(self, bg, text, card_bg, card_text, accent, shadow, focus_border):
         self.bg = bg
@@ -39,18 +41,37 @@ class ThemeManager:
             cls._instance = super(ThemeManager, cls).__new__(cls)
             cls._instance.is_dark = False
             cls._instance.current_theme = LIGHT_THEME
+            # テーマが切り替わるたびに増えるバージョン（適用済みかどうかの判定用）
+            cls._instance.version = 0
+            # テーマ（is_dark）ごとに生成済みのスタイルシートを保持
+            cls._instance._style_sheet_cache = {}
         return cls._instance
 
     def toggle_theme(self):
         self.is_dark = not self.is_dark
         self.current_theme = DARK_THEME if self.is_dark else LIGHT_THEME
+        self.version += 1
     
     def get_style_sheet(self):
+        sheet = self._style_sheet_cache.get(self.is_dark)
+        if sheet is None:
+            sheet = self._build_style_sheet()
+            self._style_sheet_cache[self.is_dark] = sheet
+        return sheet
+
+    def _build_style_sheet(self):
         t = self.current_theme
         hover_bg = "#FAFAFA" if not self.is_dark else "#252525"
         
         # フォーカスタスク（現在集中すべきタスク）の背景色 #3
         focus_bg = "#E3F2FD" if not self.is_dark else "#1A2634"
+
+        # 長押しで持ち上げたカードの背景（差し色 Alpha 25 = ~10%）
+        accent = QColor(t.accent)
+        lifted_bg = f"rgba({accent.red()}, {accent.green()}, {accent.blue()}, 25)"
+
+        # カード本体の外側は影を描くための透明な余白（TaskWidget.paintEvent が描画）
+        m_left, m_top, m_right, m_bottom = CARD_SHADOW_MARGINS
         
         # タイトル描画用の左バー色はここで定義
         section_title_style = f"""
@@ -81,17 +102,30 @@ class ThemeManager:
 
             QFrame#TaskCard {{
                 background-color: {t.card_bg};
-                border-radius: 14px;
+                border-radius: {CARD_RADIUS}px;
                 border: 2px solid transparent;
                 padding: 16px;
+                margin: {m_top}px {m_right}px {m_bottom}px {m_left}px;
             }}
             QFrame#TaskCard:hover {{
                 background-color: {hover_bg};
             }}
+            /* カードの状態は TaskWidget が card_state プロパティで切り替える */
+            QFrame#TaskCard[card_state="hover"] {{
+                background-color: {hover_bg};
+            }}
+            QFrame#TaskCard[card_state="pressed"] {{
+                background-color: {hover_bg};
+            }}
             QFrame#TaskCard[is_focus="true"] {{
                 background-color: {focus_bg};
                 border: 2px solid {t.focus_border};
             }}
+            /* 持ち上げ中はフォーカスより優先（ボーダーもアクセントにして「掴んでいる」感を出す） */
+            QFrame#TaskCard[card_state="lifted"] {{
+                background-color: {lifted_bg};
+                border: 2px solid {t.accent};
+            }}
             QLabel#TaskTitle {{
                 font-size: 22px;
                 font-weight: bold;